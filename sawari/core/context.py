@@ -10,6 +10,9 @@ This module provides functionality for parsing and managing external context
 Context can be provided via file paths, JSON strings, or KEY=VALUE pairs.
 """
 
+# Separator between KEY=VALUE pairs (commas and/or whitespace)
+_CONTEXT_SEPARATOR_PATTERN = re.compile(r'[,\s]+')
+
 
 class ContextPolicy:
     """Policy options for handling context/file variable collisions."""
@@ -78,7 +81,7 @@ def parse_context_input(context_input):
     # 3. Parse as KEY=VALUE format
     context = {}
     # Split by comma or whitespace, filter empty strings
-    items = [item.strip() for item in re.split(r'[,\s]+', context_input) if item.strip()]
+    items = [item.strip() for item in _CONTEXT_SEPARATOR_PATTERN.split(context_input) if item.strip()]
 
     if not items:
         raise ValueError("No context variables found in input")
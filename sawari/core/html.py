@@ -1,5 +1,5 @@
 import re
-from bs4 import BeautifulSoup, Comment
+from bs4 import BeautifulSoup, Comment, Tag
 from sawari.core.url_utils import is_url_pattern, is_path_pattern, is_filename_pattern
 
 """
@@ -12,6 +12,13 @@ This module provides functions to:
 - Support multiple HTML parser backends (lxml, html.parser, html5lib, html5-parser)
 """
 
+# Pre-compiled regex patterns for URLs found in HTML comments
+_COMMENT_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_COMMENT_ATTR_PATTERN = re.compile(r'(?:href|src|action|data)\s*=\s*["\']([^"\']+)["\']')
+_COMMENT_PATH_PATTERN = re.compile(
+    r'(?:^|[\s,;])((?:/[a-zA-Z0-9_\-./{}: ]+)|(?:\./[a-zA-Z0-9_\-./]+)|(?:\.\./[a-zA-Z0-9_\-./]+))'
+)
+
 
 def extract_urls_from_html(html_string, placeholder='FUZZ', html_parser='lxml'):
     """
@@ -89,9 +96,22 @@ def extract_urls_from_html(html_string, placeholder='FUZZ', html_parser='lxml'):
         # Also check for common data attributes on any tag
         data_attrs = ['data-url', 'data-href', 'data-src']
 
+        # Walk the document once, bucketing tags by name (in document order)
+        # and collecting comments, instead of one full find_all() pass per
+        # tag type plus separate passes for data-* attributes and comments
+        all_tags = []
+        tags_by_name = {}
+        comments = []
+        for element in soup.descendants:
+            if isinstance(element, Tag):
+                all_tags.append(element)
+                tags_by_name.setdefault(element.name, []).append(element)
+            elif isinstance(element, Comment):
+                comments.append(element)
+
         # Extract URLs from each tag type
         for tag_name, attr_names in url_extractors:
-            for tag in soup.find_all(tag_name):
+            for tag in tags_by_name.get(tag_name, ()):
                 for attr_name in attr_names:
                     url = tag.get(attr_name)
                     if url and url.strip():
@@ -119,7 +139,7 @@ def extract_urls_from_html(html_string, placeholder='FUZZ', html_parser='lxml'):
                                 entries.append(entry)
 
         # Extract from data-* attributes on all tags
-        for tag in soup.find_all(True):  # True matches all tags
+        for tag in all_tags:
             for data_attr in data_attrs:
                 url = tag.get(data_attr)
                 if url and url.strip():
@@ -141,23 +161,20 @@ def extract_urls_from_html(html_string, placeholder='FUZZ', html_parser='lxml'):
                         entries.append(entry)
 
         # Extract URLs from HTML comments
-        for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
+        for comment in comments:
             comment_text = str(comment).strip()
             if comment_text:
                 # Extract URLs using regex patterns
                 found_urls = []
 
                 # Match full URLs
-                url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-                found_urls.extend(re.findall(url_pattern, comment_text))
+                found_urls.extend(_COMMENT_URL_PATTERN.findall(comment_text))
 
                 # Extract URLs from href/src/action attributes (for commented HTML)
-                attr_pattern = r'(?:href|src|action|data)\s*=\s*["\']([^"\']+)["\']'
-                found_urls.extend(re.findall(attr_pattern, comment_text))
+                found_urls.extend(_COMMENT_ATTR_PATTERN.findall(comment_text))
 
                 # Match path patterns
-                path_pattern = r'(?:^|[\s,;])((?:/[a-zA-Z0-9_\-./{}: ]+)|(?:\./[a-zA-Z0-9_\-./]+)|(?:\.\./[a-zA-Z0-9_\-./]+))'
-                found_paths = re.findall(path_pattern, comment_text)
+                found_paths = _COMMENT_PATH_PATTERN.findall(comment_text)
                 found_urls.extend(found_paths)
 
                 for url in found_urls:
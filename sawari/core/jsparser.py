@@ -1,12 +1,41 @@
-import tree_sitter_javascript
+import threading
 
+from functools import lru_cache
 from tree_sitter import Language, Parser
 
 
-def parse_javascript(code):
-    JS_LANGUAGE = Language(tree_sitter_javascript.language())
-    parser = Parser(JS_LANGUAGE)
-    tree = parser.parse(bytes(code, 'utf8'))
+@lru_cache(maxsize=None)
+def get_language():
+    """Returns the JavaScript grammar, loading it on first use.
+
+    The grammar package pulls in importlib.resources and friends, so importing
+    it lazily keeps that cost off imports that never parse anything.
+    """
+    import tree_sitter_javascript
+
+    return Language(tree_sitter_javascript.language())
+
+
+# Parser objects are not thread-safe, so each thread reuses its own. Trees do not
+# depend on the parser once built, so nested parses (comments, inline scripts)
+# can share it too.
+_parser_state = threading.local()
+
+
+def get_parser():
+    """Returns this thread's JavaScript parser, creating it on first use."""
+    parser = getattr(_parser_state, 'parser', None)
+    if parser is None:
+        parser = _parser_state.parser = Parser(get_language())
+    return parser
+
+
+def parse_javascript(code, parser=None):
+    # Accept UTF-8 bytes as-is so callers holding raw file contents skip a decode/encode round trip
+    source = code if isinstance(code, bytes) else bytes(code, 'utf8')
+    if parser is None:
+        parser = get_parser()
+    tree = parser.parse(source)
     root_node = tree.root_node
 
-    return JS_LANGUAGE, root_node
+    return get_language(), root_node
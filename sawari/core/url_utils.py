@@ -12,6 +12,27 @@ Used by both the HTML parser and JavaScript string extraction.
 # Cache for file extensions
 _file_extensions = None
 
+# Pre-compiled regex patterns at module level for performance
+# is_url_pattern() and is_path_pattern() run on every string literal
+_SINGLE_CHAR_DIGITS_PATTERN = re.compile(r'^[a-zA-Z]\d+$')
+_PROTOCOL_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://')
+_COMMON_PREFIX_PATTERN = re.compile(r'^(www\.|api\.|cdn\.)', re.IGNORECASE)
+_IP_ADDRESS_PATTERN = re.compile(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d+)?(/|$)')
+_DOMAIN_WITH_TLD_PATTERN = re.compile(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}')
+_DOMAIN_WITH_PATH_PATTERN = re.compile(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+/')
+_WORD_DOT_WORD_PATTERN = re.compile(r'^[a-z]+\.[a-z]+$', re.IGNORECASE)
+# Spaces or punctuation in a dotted query base indicate text, not a domain
+_QUERY_BASE_REJECT_PATTERN = re.compile(r'[ ;:,!@#$%^&*()+=\[\]{}\'"]')
+_QUERY_BASE_DOMAIN_PATTERN = re.compile(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+$')
+_QUERY_BASE_WORD_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+_ABSOLUTE_PATH_PATTERN = re.compile(r'^/[a-zA-Z0-9_-]{2,}')
+_RELATIVE_PATH_PATTERN = re.compile(r'^\.\.?/')
+_API_PATH_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*/[a-zA-Z0-9]')
+
+# Natural language indicators (prose strings, not URLs)
+_PROSE_INDICATORS = ('has been', 'must be', 'called on', 'this means', 'please change',
+                     'will never', 'in favor of', 'for the full', 'deprecated')
+
 
 def load_file_extensions():
     """
@@ -74,7 +95,7 @@ def is_filename_pattern(text, custom_extensions=None):
 
     # Reject if basename is too short (likely property access like 'a.b')
     # Allow at least 2 characters or common single-char prefixes with numbers
-    if len(basename) < 2 and not re.match(r'^[a-zA-Z]\d+$', basename):
+    if len(basename) < 2 and not _SINGLE_CHAR_DIGITS_PATTERN.match(basename):
         return False
 
     # Check if extension is valid
@@ -118,14 +139,12 @@ def is_url_pattern(text):
         return False
 
     # Early rejection: natural language indicators
-    prose_indicators = ['has been', 'must be', 'called on', 'this means', 'please change',
-                        'will never', 'in favor of', 'for the full', 'deprecated']
     text_lower = text.lower()
-    if any(phrase in text_lower for phrase in prose_indicators):
+    if any(phrase in text_lower for phrase in _PROSE_INDICATORS):
         return False
 
     # Protocol URLs
-    if re.match(r'^[a-zA-Z][a-zA-Z0-9+.-]*://', text):
+    if _PROTOCOL_PATTERN.match(text):
         return True
 
     # Protocol-relative
@@ -133,23 +152,23 @@ def is_url_pattern(text):
         return True
 
     # Common prefixes
-    if re.match(r'^(www\.|api\.|cdn\.)', text, re.IGNORECASE):
+    if _COMMON_PREFIX_PATTERN.match(text):
         return True
 
     # IP addresses (with optional port)
-    if re.match(r'^\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}(:\d+)?(/|$)', text):
+    if _IP_ADDRESS_PATTERN.match(text):
         return True
 
     # Domain patterns (at least one dot, valid TLD-like structure)
     # Require either: a known TLD, a slash after domain, or port number
     # Reject: single-word domains, Vue directives, object properties
-    if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+\.[a-zA-Z]{2,}', text):  # Has TLD
+    if _DOMAIN_WITH_TLD_PATTERN.match(text):  # Has TLD
         return True
-    if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9-]+/', text):  # Has path after domain
+    if _DOMAIN_WITH_PATH_PATTERN.match(text):  # Has path after domain
         return True
 
     # Reject common false positives
-    if re.match(r'^[a-z]+\.[a-z]+$', text, re.IGNORECASE):
+    if _WORD_DOT_WORD_PATTERN.match(text):
         # Simple word.word (like mr.flatpickr, user.firstname)
         return False
 
@@ -183,10 +202,8 @@ def is_path_pattern(text):
         return False
 
     # Early rejection: natural language indicators
-    prose_indicators = ['has been', 'must be', 'called on', 'this means', 'please change',
-                        'will never', 'in favor of', 'for the full', 'deprecated']
     text_lower = text.lower()
-    if any(phrase in text_lower for phrase in prose_indicators):
+    if any(phrase in text_lower for phrase in _PROSE_INDICATORS):
         return False
 
     # Reject protocol-relative URLs
@@ -222,30 +239,30 @@ def is_path_pattern(text):
             # Check if it looks like a domain, not just any text with dots
             # Should not have spaces, special chars except dash/underscore
             # Should look like domain.com pattern
-            if ' ' in base or re.search(r'[;:,!@#$%^&*()+=\[\]{}\'"]', base):
+            if _QUERY_BASE_REJECT_PATTERN.search(base):
                 return False
             # Must have alphanumeric parts separated by dots
-            if re.match(r'^[a-zA-Z0-9-]+\.[a-zA-Z0-9.-]+$', base):
+            if _QUERY_BASE_DOMAIN_PATTERN.match(base):
                 return True  # Domains like 'example.com?query'
             return False
         # Single word before ? (like 'ABC?query') - check if it looks URL-like
         # Allow it if it has other URL indicators in the full text
         # Must be alphanumeric with limited special chars
-        if re.match(r'^[a-zA-Z0-9_-]+$', base):
+        if _QUERY_BASE_WORD_PATTERN.match(base):
             return len(base) >= 2  # Minimum length for base part
         return False
 
     # Absolute paths (minimum 2 chars after /)
     # Match: /path, /path/more, /path?query, /path#hash, /path?q#h
-    if re.match(r'^/[a-zA-Z0-9_-]{2,}', text):
+    if _ABSOLUTE_PATH_PATTERN.match(text):
         return True
 
     # Relative paths
-    if re.match(r'^\.\.?/', text):
+    if _RELATIVE_PATH_PATTERN.match(text):
         return True
 
     # API paths (word/word pattern)
-    if re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*/[a-zA-Z0-9]', text):
+    if _API_PATH_PATTERN.match(text):
         return True
 
     return False
@@ -45,7 +45,7 @@ def inspect_nodes(node, get_types, types):
     result_text = []
     result_set = set()
 
-    types = None if types is None or len(types) == 0 else set(types)
+    types = frozenset(types) if types else None
     traverse_node(node, types)
 
     return result_text
@@ -15,7 +15,7 @@ Example usage:
     urls = get_urls(root_node, 'FUZZ', include_templates=True, verbose=False)
 """
 
-# Main extraction function
+# Main extraction functions
 from .extractor import get_urls
 
 # Configuration utilities
@@ -113,7 +113,8 @@ def get_best_alias(var_name, alias_table=None):
     return var_name
 
 
-def extract_local_aliases(node, variables_to_find, alias_table=None, disable_semantic_aliases=False):
+def extract_local_aliases(node, variables_to_find, alias_table=None, disable_semantic_aliases=False,
+                          block_alias_index=None):
     """
     Extracts aliases from the local context (current function scope or nearby nodes).
     This is called during pass 2 when we encounter template strings/concatenations.
@@ -123,6 +124,9 @@ def extract_local_aliases(node, variables_to_find, alias_table=None, disable_sem
     - variables_to_find: Set of variable names we want to find aliases for
     - alias_table: Optional alias table (not used directly, but for consistency)
     - disable_semantic_aliases: If True, return empty dict (use raw variable names)
+    - block_alias_index: Optional dict caching every alias candidate of a block,
+      keyed by block node id. Share it across calls on the same tree so each
+      enclosing block is scanned once instead of once per template/concatenation.
 
     Returns:
     - Dictionary mapping variable names to their best local alias
@@ -164,67 +168,17 @@ def extract_local_aliases(node, variables_to_find, alias_table=None, disable_sem
 
         # Look for nearby patterns in the same block or program
         if current.type in ['statement_block', 'program']:
-            for sibling in current.named_children:
-                # Check variable declarations with object literals
-                if sibling.type in ['lexical_declaration', 'variable_declaration']:
-                    for declarator in sibling.named_children:
-                        if declarator.type == 'variable_declarator':
-                            value = declarator.child_by_field_name('value')
-                            # Object literal: const obj = { id: x }
-                            if value and value.type == 'object':
-                                _collect_aliases_from_pattern(value, variables_to_find, all_aliases)
-                            # Destructuring: const {id: x} = obj
-                            elif value and value.type == 'object_pattern':
-                                _collect_aliases_from_pattern(value, variables_to_find, all_aliases)
-                            # Check if the name itself is a destructuring pattern
-                            name = declarator.child_by_field_name('name')
-                            if name and name.type == 'object_pattern':
-                                _collect_aliases_from_pattern(name, variables_to_find, all_aliases)
-
-                # Check for FormData.append() calls
-                if sibling.type == 'expression_statement':
-                    # expression_statement doesn't have 'expression' field, use first named child
-                    named_children = sibling.named_children
-                    if named_children:
-                        expr = named_children[0]
-                        if expr.type == 'call_expression':
-                            # Check if it's formData.append('key', value)
-                            func_node = expr.child_by_field_name('function')
-                            if func_node and func_node.type == 'member_expression':
-                                prop = func_node.child_by_field_name('property')
-                                if prop and prop.text.decode('utf8') == 'append':
-                                    # Get arguments
-                                    args_node = expr.child_by_field_name('arguments')
-                                    if args_node:
-                                        args = [c for c in args_node.named_children]
-                                        if len(args) >= 2:
-                                            # First arg is the key (string)
-                                            # Second arg is the value (could be variable)
-                                            key_node = args[0]
-                                            value_node = args[1]
-
-                                            if key_node.type == 'string' and value_node.type == 'identifier':
-                                                key = extract_string_value(key_node)
-                                                var_name = value_node.text.decode('utf8')
-                                                if var_name in variables_to_find:
-                                                    if var_name not in all_aliases:
-                                                        all_aliases[var_name] = []
-                                                    all_aliases[var_name].append(key)
-
-                # Check for URLSearchParams constructor: new URLSearchParams({key: value})
-                if sibling.type in ['lexical_declaration', 'variable_declaration']:
-                    for declarator in sibling.named_children:
-                        if declarator.type == 'variable_declarator':
-                            value = declarator.child_by_field_name('value')
-                            if value and value.type == 'new_expression':
-                                # Check if it's URLSearchParams
-                                constructor = value.child_by_field_name('constructor')
-                                if constructor and constructor.text.decode('utf8') == 'URLSearchParams':
-                                    args_node = value.child_by_field_name('arguments')
-                                    if args_node:
-                                        args = [c for c in args_node.named_children]
-                                        if args and args[0].type == 'object':
-                                            _collect_aliases_from_pattern(args[0], variables_to_find, all_aliases)
+            if block_alias_index is None:
+                _collect_block_aliases(current, variables_to_find, all_aliases)
+            else:
+                block_aliases = block_alias_index.get(current.id)
+                if block_aliases is None:
+                    block_aliases = {}
+                    _collect_block_aliases(current, None, block_aliases)
+                    block_alias_index[current.id] = block_aliases
+                for var_name in variables_to_find:
+                    if var_name in block_aliases:
+                        all_aliases.setdefault(var_name, []).extend(block_aliases[var_name])
 
         current = current.parent
 
@@ -232,10 +186,80 @@ def extract_local_aliases(node, variables_to_find, alias_table=None, disable_sem
     return _choose_best_aliases(all_aliases)
 
 
+def _collect_block_aliases(block_node, variables_to_find, all_aliases_dict):
+    """
+    Helper to collect aliases from the statements directly inside a block or program:
+    object literals and destructuring in declarations, FormData.append() calls and
+    URLSearchParams constructors. A variables_to_find of None collects every variable.
+    """
+    for sibling in block_node.named_children:
+        # Check variable declarations with object literals
+        if sibling.type in ['lexical_declaration', 'variable_declaration']:
+            for declarator in sibling.named_children:
+                if declarator.type == 'variable_declarator':
+                    value = declarator.child_by_field_name('value')
+                    # Object literal: const obj = { id: x }
+                    if value and value.type == 'object':
+                        _collect_aliases_from_pattern(value, variables_to_find, all_aliases_dict)
+                    # Destructuring: const {id: x} = obj
+                    elif value and value.type == 'object_pattern':
+                        _collect_aliases_from_pattern(value, variables_to_find, all_aliases_dict)
+                    # Check if the name itself is a destructuring pattern
+                    name = declarator.child_by_field_name('name')
+                    if name and name.type == 'object_pattern':
+                        _collect_aliases_from_pattern(name, variables_to_find, all_aliases_dict)
+
+        # Check for FormData.append() calls
+        if sibling.type == 'expression_statement':
+            # expression_statement doesn't have 'expression' field, use first named child
+            named_children = sibling.named_children
+            if named_children:
+                expr = named_children[0]
+                if expr.type == 'call_expression':
+                    # Check if it's formData.append('key', value)
+                    func_node = expr.child_by_field_name('function')
+                    if func_node and func_node.type == 'member_expression':
+                        prop = func_node.child_by_field_name('property')
+                        if prop and prop.text.decode('utf8') == 'append':
+                            # Get arguments
+                            args_node = expr.child_by_field_name('arguments')
+                            if args_node:
+                                args = [c for c in args_node.named_children]
+                                if len(args) >= 2:
+                                    # First arg is the key (string)
+                                    # Second arg is the value (could be variable)
+                                    key_node = args[0]
+                                    value_node = args[1]
+
+                                    if key_node.type == 'string' and value_node.type == 'identifier':
+                                        key = extract_string_value(key_node)
+                                        var_name = value_node.text.decode('utf8')
+                                        if variables_to_find is None or var_name in variables_to_find:
+                                            if var_name not in all_aliases_dict:
+                                                all_aliases_dict[var_name] = []
+                                            all_aliases_dict[var_name].append(key)
+
+        # Check for URLSearchParams constructor: new URLSearchParams({key: value})
+        if sibling.type in ['lexical_declaration', 'variable_declaration']:
+            for declarator in sibling.named_children:
+                if declarator.type == 'variable_declarator':
+                    value = declarator.child_by_field_name('value')
+                    if value and value.type == 'new_expression':
+                        # Check if it's URLSearchParams
+                        constructor = value.child_by_field_name('constructor')
+                        if constructor and constructor.text.decode('utf8') == 'URLSearchParams':
+                            args_node = value.child_by_field_name('arguments')
+                            if args_node:
+                                args = [c for c in args_node.named_children]
+                                if args and args[0].type == 'object':
+                                    _collect_aliases_from_pattern(args[0], variables_to_find, all_aliases_dict)
+
+
 def _collect_aliases_from_pattern(pattern_node, variables_to_find, all_aliases_dict):
     """
     Helper to collect aliases from an object literal or destructuring pattern.
-    Appends to the list of aliases for each variable.
+    Appends to the list of aliases for each variable (every variable if
+    variables_to_find is None).
     """
     if pattern_node.type not in ['object', 'object_pattern']:
         return
@@ -254,7 +278,7 @@ def _collect_aliases_from_pattern(pattern_node, variables_to_find, all_aliases_d
             # Check if value is an identifier we care about
             if value_node.type == 'identifier':
                 var_name = value_node.text.decode('utf8')
-                if var_name in variables_to_find:
+                if variables_to_find is None or var_name in variables_to_find:
                     if var_name not in all_aliases_dict:
                         all_aliases_dict[var_name] = []
                     all_aliases_dict[var_name].append(prop_name)
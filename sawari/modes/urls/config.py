@@ -4,29 +4,36 @@ Configuration loading for URL extraction.
 Handles MIME types and custom file extensions.
 """
 import importlib.resources
+import threading
+
 from functools import lru_cache
 
-# Global variable to store custom file extensions for the current extraction
-_custom_file_extensions = set()
+# Custom file extensions for the current extraction, kept per thread so
+# concurrent get_urls() calls with different --extensions don't interfere
+_extraction_state = threading.local()
+_NO_EXTENSIONS = frozenset()
+
+# Node types whose children (string fragments, escape sequences) never hold
+# anything either pass acts on, so the AST walks do not descend into them
+LEAF_NODE_TYPES = frozenset(('string', 'comment', 'hash_bang_line'))
 
 
 def get_custom_extensions():
-    """Return the current custom file extensions."""
-    return _custom_file_extensions
+    """Return the current thread's custom file extensions."""
+    return getattr(_extraction_state, 'custom_file_extensions', _NO_EXTENSIONS)
 
 
 def set_custom_extensions(extensions):
     """
-    Set custom file extensions.
+    Set custom file extensions for the current thread.
 
     Parameters:
     - extensions: Comma-separated string of extensions or a set of extensions
     """
-    global _custom_file_extensions
-    _custom_file_extensions = set()
+    custom_file_extensions = set()
 
     if isinstance(extensions, set):
-        _custom_file_extensions = extensions
+        custom_file_extensions = extensions
     elif extensions:
         for ext in extensions.split(','):
             ext = ext.strip()
@@ -34,7 +41,10 @@ def set_custom_extensions(extensions):
                 # Normalize: remove dot prefix if present, then lowercase
                 if ext.startswith('.'):
                     ext = ext[1:]
-                _custom_file_extensions.add(ext.lower())
+                custom_file_extensions.add(ext.lower())
+
+    # Publish the finished set in one assignment so readers never see it half-built
+    _extraction_state.custom_file_extensions = custom_file_extensions
 
 
 @lru_cache(maxsize=1)
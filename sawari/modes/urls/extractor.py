@@ -57,14 +57,16 @@ def get_urls(node, placeholder, include_templates, verbose, file_size=0, max_nod
         inline_scripts = extract_inline_scripts_from_html(source_text, html_parser=html_parser)
         for script_code in inline_scripts:
             try:
-                _, script_root_node = parse_javascript(script_code)
+                # Encode once: the parser and the size check both use the UTF-8 bytes
+                script_source = script_code.encode('utf8')
+                _, script_root_node = parse_javascript(script_source)
                 # Recursively call get_urls on the inline script
                 script_urls = get_urls(
                     script_root_node,
                     placeholder,
                     include_templates,
                     verbose,
-                    len(script_code),
+                    len(script_source),
                     max_nodes,
                     max_file_size_mb,
                     html_parser,
@@ -91,12 +93,39 @@ def get_urls(node, placeholder, include_templates, verbose, file_size=0, max_nod
 
         return unique_result
 
+    # Semantic aliases only rename {var} names in templated output, so
+    # skip the alias scans entirely when templates are not requested
+    url_entries, mime_types = _extract_url_entries(
+        node, placeholder, verbose, file_size, max_nodes, max_file_size_mb,
+        html_parser, skip_symbols, skip_aliases, context, context_policy, extensions,
+        resolve_aliases=include_templates
+    )
+
+    # Format and return
+    return format_output(url_entries, include_templates, placeholder, mime_types)
+
+
+def _extract_url_entries(node, placeholder, verbose, file_size=0, max_nodes=1000000,
+                         max_file_size_mb=1.0, html_parser='lxml', skip_symbols=False,
+                         skip_aliases=False, context=None, context_policy='merge', extensions=None,
+                         resolve_aliases=True):
+    """
+    Runs both extraction passes over a JavaScript AST without formatting.
+
+    Parameters:
+    - Same as get_urls, minus include_templates and source_text
+    - resolve_aliases: Look up semantic aliases for {var} names (default: True).
+      Aliases only change the templated 'original' values, so callers that
+      format with include_templates=False can pass False to skip that work.
+
+    Returns:
+    - Tuple of (url_entries, mime_types) for format_output
+    """
     # Initialize state for this extraction
     url_entries = []
     symbol_table = {}
     object_table = {}
     array_table = {}
-    alias_table = {}  # Track semantic aliases for variable names
     seen_urls = set()
     node_visit_count = [0]
     max_nodes_limit = max_nodes
@@ -124,7 +153,11 @@ def get_urls(node, placeholder, include_templates, verbose, file_size=0, max_nod
 
     skip_symbols = skip_symbols or (is_large_file and not force_symbol_resolution)
     skip_aliases = skip_aliases or is_large_file
-    disable_semantic_aliases = skip_aliases  # Control semantic alias extraction
+    disable_semantic_aliases = skip_aliases or not resolve_aliases  # Control semantic alias extraction
+
+    # Track semantic aliases for variable names; when aliases are disabled no
+    # alias state is allocated and pass 1 skips the alias scans altogether
+    alias_table = None if disable_semantic_aliases else {}
 
     if verbose:
         if is_large_file and not force_symbol_resolution:
@@ -157,5 +190,4 @@ def get_urls(node, placeholder, include_templates, verbose, file_size=0, max_nod
         node_visit_count, max_nodes_limit
     )
 
-    # Format and return
-    return format_output(url_entries, include_templates, placeholder, mime_types)
+    return url_entries, mime_types
@@ -5,6 +5,7 @@ Handles junk URL detection, bracket balancing, and placeholder consolidation.
 """
 import re
 
+from functools import lru_cache
 from .config import load_mime_types, get_custom_extensions
 from sawari.core.url_utils import is_filename_pattern
 
@@ -56,22 +57,33 @@ _STANDALONE_DATE_PATTERN = re.compile(
     re.IGNORECASE
 )
 
+# Date, time and timezone families merged into one anchored alternation, so
+# is_junk_url makes a single match() call for all of them. Scoped (?i:...)
+# groups keep each family's own case sensitivity.
+_FORMAT_JUNK_PATTERN = re.compile('|'.join(
+    f'(?i:{pattern.pattern})' if pattern.flags & re.IGNORECASE else f'(?:{pattern.pattern})'
+    for pattern in (
+        _DATE_YMD_PATTERN, _DATE_DMY_PATTERN, _DATE_MDY_PATTERN,
+        _TIME_FORMAT_PATTERN, _TIMEZONE_PATTERN, _STANDALONE_DATE_PATTERN,
+    )
+))
+
 # Regex backreference pattern
 _REGEX_BACKREFERENCE_PATTERN = re.compile(r'\$\d')
 
 # Alphanumeric content check
 _HAS_ALPHANUMERIC_PATTERN = re.compile(r'[a-zA-Z0-9]')
 
-# CSS unit pattern (placeholder-independent part, we combine with placeholder at check time)
+# CSS units (combined with the placeholder once per placeholder, see _placeholder_junk_matches)
 _CSS_UNITS = ('px', 'em', 'rem', '%', 'vh', 'vw', 'vmin', 'vmax', 'ch', 'ex', 'pt', 'pc', 'in', 'cm', 'mm', 'deg', 'rad', 'turn', 's', 'ms')
 
-# JavaScript API patterns (pre-compiled list)
-_JS_API_PATTERNS = [
-    re.compile(r'^(Function|Object|Array|String|Number|Boolean|Symbol|Map|Set|WeakMap|WeakSet|Promise|Proxy|Reflect)\.'),
-    re.compile(r'^(moment|Immutable|Redux|React|Vue|Angular)\.'),
-    re.compile(r'\.prototype\.'),
-    re.compile(r'\.(bind|call|apply|toString|valueOf)\s*$'),
-]
+# JavaScript API patterns, one alternation searched once per string
+_JS_API_PATTERN = re.compile(
+    r'^(?:Function|Object|Array|String|Number|Boolean|Symbol|Map|Set|WeakMap|WeakSet|Promise|Proxy|Reflect)\.'
+    r'|^(?:moment|Immutable|Redux|React|Vue|Angular)\.'
+    r'|\.prototype\.'
+    r'|\.(?:bind|call|apply|toString|valueOf)\s*$'
+)
 
 # Pre-computed sets for O(1) exact match lookups
 _JUNK_EXACT_MATCHES = frozenset({
@@ -86,6 +98,33 @@ _JUNK_PREFIXES = (
 )
 
 
+@lru_cache(maxsize=16)
+def _adjacent_placeholders_pattern(placeholder):
+    """Compiled pattern matching 2+ consecutive placeholders (one per placeholder)."""
+    return re.compile(f'(?:{re.escape(placeholder)}){{2,}}')
+
+
+@lru_cache(maxsize=16)
+def _placeholder_junk_matches(placeholder):
+    """Exact junk strings built from the placeholder (https://FUZZ, /FUZZ, FUZZpx, ...)."""
+    return frozenset((
+        # Protocol + only placeholder (no actual domain/path info)
+        f'https://{placeholder}', f'https://{placeholder}/',
+        f'http://{placeholder}', f'http://{placeholder}/',
+        # Too generic paths
+        f'/{placeholder}', f'//{placeholder}',
+        # CSS units from template strings like `${value}px`
+        *(f'{placeholder}{unit}' for unit in _CSS_UNITS),
+    ))
+
+
+@lru_cache(maxsize=16)
+def _placeholder_only_path_pattern(placeholder):
+    """Compiled pattern matching paths made only of slash-separated placeholders (FUZZ/FUZZ)."""
+    escaped = re.escape(placeholder)
+    return re.compile(f'{escaped}(?:/{escaped})+$')
+
+
 def clean_unbalanced_brackets(text):
     """
     Removes trailing unbalanced brackets/parentheses from URLs.
@@ -119,47 +158,17 @@ def clean_trailing_sentence_punctuation(text):
     """
     Removes trailing sentence punctuation from URLs that is likely not part of the URL.
 
-    A trailing period/comma is removed when it appears to be sentence punctuation:
-    - After a path ending with / (e.g., 'http://example.com/path/.')
-    - After a fragment (e.g., 'http://example.com/#section.')
-    - After common non-extension endings (numbers, hyphens)
-
-    Does NOT remove period if it looks like a file extension:
-    - 'http://example.com/file.html' - keeps .html
-    - 'http://example.com/LICENSE-2.0' - keeps as-is (no trailing period)
+    Every trailing run of periods and commas is stripped, whatever precedes it:
+    - 'http://example.com/path/.' -> 'http://example.com/path/'
+    - 'http://example.com/file.html.' -> 'http://example.com/file.html'
+    - 'http://example.com/LICENSE-2.0' is returned unchanged
     """
     if not text or not isinstance(text, str):
         return text
 
-    # Only process if ends with sentence punctuation
-    if not text.endswith(('.', ',')):
-        return text
-
-    # Remove trailing punctuation
-    cleaned = text.rstrip('.,')
-
-    # If the cleaned URL ends with / or # or ), the punctuation was definitely sentence-level
-    if cleaned.endswith(('/', '#', ')')):
-        return cleaned
-
-    # If the last segment (after last /) doesn't look like a file with extension, strip it
-    # e.g., "LICENSE-2.0." -> "LICENSE-2.0" (the . was punctuation, not extension)
-    last_slash = cleaned.rfind('/')
-    if last_slash >= 0:
-        last_segment = cleaned[last_slash + 1:]
-        # If there's no dot in the last segment, the trailing dot was punctuation
-        if '.' not in last_segment:
-            return cleaned
-        # If there's a dot but it's part of a version number (e.g., 2.0), strip trailing punct
-        # Check if what's after the last dot in segment is not a typical extension
-        last_dot = last_segment.rfind('.')
-        if last_dot >= 0:
-            potential_ext = last_segment[last_dot + 1:]
-            # Common extensions are 2-4 chars, alphanumeric
-            if not (2 <= len(potential_ext) <= 4 and potential_ext.isalnum()):
-                return cleaned
-
-    return cleaned
+    # The earlier /, #, ) and file-extension checks all returned this same
+    # stripped value, so they reduce to one rstrip
+    return text.rstrip('.,')
 
 
 def is_junk_url(text, placeholder='FUZZ', mime_types=None):
@@ -188,6 +197,12 @@ def is_junk_url(text, placeholder='FUZZ', mime_types=None):
     if text in _JUNK_EXACT_MATCHES:
         return True
 
+    # Placeholder-dependent exact matches, built once per placeholder
+    # Matches: https://FUZZ, https://FUZZ/, http://FUZZ/, /FUZZ, //FUZZ, FUZZpx, FUZZ%
+    # But NOT template variables like https://{domain} which are meaningful
+    if text in _placeholder_junk_matches(placeholder):
+        return True
+
     # Fast path: prefix check
     if text.startswith(_JUNK_PREFIXES):
         return True
@@ -209,13 +224,6 @@ def is_junk_url(text, placeholder='FUZZ', mime_types=None):
     if _STANDALONE_PROTOCOL_PATTERN.match(text):
         return True
 
-    # Protocol + only placeholder (no actual domain/path info)
-    # Matches: https://FUZZ, https://FUZZ/, http://FUZZ, http://FUZZ/
-    # But NOT template variables like https://{domain} which are meaningful
-    if text == f'https://{placeholder}' or text == f'https://{placeholder}/' or \
-       text == f'http://{placeholder}' or text == f'http://{placeholder}/':
-        return True
-
     # Property paths (word.word.word without slashes)
     # BUT exclude legitimate filenames with valid extensions
     if _PROPERTY_PATH_PATTERN.match(text) and '/' not in text:
@@ -227,37 +235,19 @@ def is_junk_url(text, placeholder='FUZZ', mime_types=None):
     if _GENERIC_SINGLE_PARAM_PATTERN.match(text):  # /{t}, /{a}, /{n.pathname}
         return True
 
-    # Too generic paths (placeholder-dependent, must check at runtime)
-    if text in (f'/{placeholder}', f'//{placeholder}'):
-        return True
-
     # Paths that are only placeholders separated by slashes (no actual path info)
     # Examples: FUZZ/FUZZ, FUZZ/FUZZ/FUZZ/FUZZ/FUZZ
-    if re.match(f'^{re.escape(placeholder)}(/{re.escape(placeholder)})+$', text):
-        return True
-
-    # Date/time format placeholders (no actual value)
-    # Examples: /yyyy/mm/dd/, /YYYY/MM/DD/, /yyyy-mm-dd/, /dd/mm/yyyy/
-    # Also catches template versions: /yyyy/{mm}/{dd}/, /{yyyy}/{mm}/{dd}/
-    if _DATE_YMD_PATTERN.match(text):
-        return True
-    if _DATE_DMY_PATTERN.match(text):
-        return True
-    if _DATE_MDY_PATTERN.match(text):
-        return True
-    # Time format placeholders: /hh:mm:ss/, /HH:MM/, /{hh}:{mm}/, etc.
-    if _TIME_FORMAT_PATTERN.match(text):
+    if _placeholder_only_path_pattern(placeholder).match(text):
         return True
 
-    # IANA timezone identifiers and timezone data strings (from libraries like moment-timezone)
-    # Matches both clean identifiers (Europe/London) and data entries (Africa/Abidjan|LMT GMT|...)
-    # Also covers nested timezones (America/Argentina/Buenos_Aires) and legacy aliases (US/Eastern)
-    if _TIMEZONE_PATTERN.match(text):
-        return True
-
-    # Standalone date format patterns (without leading slash)
-    # Examples: MM/DD/YYYY, DD/MM/YYYY, YYYY/MM/DD, YYYY-MM-DD
-    if _STANDALONE_DATE_PATTERN.match(text):
+    # Date/time format placeholders and timezone identifiers, in one match:
+    # - Date formats: /yyyy/mm/dd/, /YYYY/MM/DD/, /yyyy-mm-dd/, /dd/mm/yyyy/
+    #   and template versions: /yyyy/{mm}/{dd}/, /{yyyy}/{mm}/{dd}/
+    # - Time formats: /hh:mm:ss/, /HH:MM/, /{hh}:{mm}/, etc.
+    # - IANA timezone identifiers and timezone data strings (from libraries like moment-timezone):
+    #   Europe/London, Africa/Abidjan|LMT GMT|..., America/Argentina/Buenos_Aires, US/Eastern
+    # - Standalone date formats (without leading slash): MM/DD/YYYY, YYYY-MM-DD
+    if _FORMAT_JUNK_PATTERN.match(text):
         return True
 
     # Regex replacement patterns (e.g., (/$1)?$2, $1/$2)
@@ -265,12 +255,6 @@ def is_junk_url(text, placeholder='FUZZ', mime_types=None):
     if _REGEX_BACKREFERENCE_PATTERN.search(text):
         return True
 
-    # CSS unit patterns (e.g., FUZZpx, FUZZ%, FUZZem, FUZZrem, FUZZvh, FUZZvw)
-    # These come from template strings like `${value}px`
-    # Use string operations instead of regex for speed
-    if text.startswith(placeholder) and text[len(placeholder):] in _CSS_UNITS:
-        return True
-
     # Non-meaningful placeholder strings
     # After stripping the placeholder, if only symbols remain (no alphanumeric chars), it's junk
     # Examples: ^FUZZ$ -> ^$, /*FUZZ*FUZZ -> /**, /?([^\/]+)? -> /?([^\/]+)?
@@ -280,7 +264,7 @@ def is_junk_url(text, placeholder='FUZZ', mime_types=None):
 
     # JavaScript standard library patterns (not URLs)
     # Matches: Function.prototype.bind, Object.prototype.hasOwnProperty, etc.
-    if any(pattern.search(text) for pattern in _JS_API_PATTERNS):
+    if _JS_API_PATTERN.search(text):
         return True
 
     # Incomplete strings ending with unclosed quotes or parentheses
@@ -310,9 +294,8 @@ def consolidate_adjacent_placeholders(text, placeholder='FUZZ'):
     This handles cases where adjacent template expressions like {t}{i}
     get replaced to become FUZZFUZZ without separators.
     """
-    if not text or placeholder not in text:
+    if not text or placeholder * 2 not in text:
         return text
 
     # Replace 2+ consecutive placeholders with single placeholder
-    pattern = f'({re.escape(placeholder)}){{2,}}'
-    return re.sub(pattern, placeholder, text)
+    return _adjacent_placeholders_pattern(placeholder).sub(placeholder, text)
@@ -7,6 +7,13 @@ import re
 
 from .filters import clean_unbalanced_brackets, clean_trailing_sentence_punctuation, is_junk_url
 
+_NON_WHITESPACE_PATTERN = re.compile(r'\S')
+
+# Pre-compiled route parameter patterns used by convert_route_params()
+_URL_AUTH_PATTERN = re.compile(r'://[^/]*@')
+_ROUTE_PARAM_PATTERN = re.compile(r'/:([a-zA-Z_][a-zA-Z0-9_]*)')
+_BRACKET_PARAM_PATTERN = re.compile(r'\[([a-zA-Z_][a-zA-Z0-9_]*)\]')
+
 
 def clean_url(text):
     """Apply all URL cleaning functions."""
@@ -33,7 +40,7 @@ def convert_route_params(text, placeholder='FUZZ'):
 
     # Check if this looks like a URL with authentication (contains ://...@)
     # If so, skip route param conversion entirely to avoid matching auth colons
-    if re.search(r'://[^/]*@', text):
+    if _URL_AUTH_PATTERN.search(text):
         # Has URL authentication, don't convert route params
         # because we might accidentally match username:password
         pass
@@ -41,15 +48,13 @@ def convert_route_params(text, placeholder='FUZZ'):
         # No authentication, safe to match route params
         # Match : followed by identifier, but only when preceded by /
         # This catches /api/:id but not plain user:password
-        route_param_pattern = r'/:([a-zA-Z_][a-zA-Z0-9_]*)'
-        if re.search(route_param_pattern, converted):
-            converted = re.sub(route_param_pattern, r'/{\1}', converted)
+        if _ROUTE_PARAM_PATTERN.search(converted):
+            converted = _ROUTE_PARAM_PATTERN.sub(r'/{\1}', converted)
             has_params = True
 
     # Match bracket parameters like [VERSION], [ID], [param]
-    bracket_param_pattern = r'\[([a-zA-Z_][a-zA-Z0-9_]*)\]'
-    if re.search(bracket_param_pattern, converted):
-        converted = re.sub(bracket_param_pattern, r'{\1}', converted)
+    if _BRACKET_PARAM_PATTERN.search(converted):
+        converted = _BRACKET_PARAM_PATTERN.sub(r'{\1}', converted)
         has_params = True
 
     return (text, converted, has_params)
@@ -63,9 +68,12 @@ def is_html_content(text):
     if not text:
         return False
 
-    text_stripped = text.strip()
-    if not text_stripped:
+    # Only the head of the content is sniffed, so skip leading whitespace
+    # instead of stripping (and copying) the whole input
+    first_char = _NON_WHITESPACE_PATTERN.search(text)
+    if not first_char:
         return False
+    text_head = text[first_char.start():first_char.start() + 200]
 
     # Check for common HTML indicators
     html_indicators = [
@@ -79,7 +87,7 @@ def is_html_content(text):
         '<BODY',
     ]
 
-    text_lower = text_stripped[:200].lower()
+    text_lower = text_head.lower()
 
     # Check for DOCTYPE or html/head/body tags near the start
     for indicator in html_indicators:
@@ -87,11 +95,11 @@ def is_html_content(text):
             return True
 
     # Check if it starts with <script> or <html-like> tags
-    if text_stripped.startswith('<') and '>' in text_stripped[:100]:
+    if text_head.startswith('<') and '>' in text_head[:100]:
         # Has opening tag structure
-        first_tag_end = text_stripped.find('>')
+        first_tag_end = text_head.find('>')
         if first_tag_end > 0:
-            first_tag = text_stripped[:first_tag_end + 1]
+            first_tag = text_head[:first_tag_end + 1]
             # Check if it looks like an HTML tag (not just a comparison operator)
             if '<script' in first_tag.lower() or first_tag.count('<') == 1:
                 return True
@@ -113,6 +121,24 @@ def format_output(url_entries, include_templates, placeholder, mime_types=None):
     - List of deduplicated, filtered URLs
     """
     results = []
+    seen = set()  # O(1) duplicate checks; results keeps order
+    cleaned = {}  # raw value -> cleaned URL, or '' when it cleans to junk
+
+    def clean_and_filter(raw):
+        # Entries repeat the same raw strings (original/placeholder/resolved and
+        # across entries), so each distinct value is cleaned and junk-checked once
+        url = cleaned.get(raw)
+        if url is None:
+            url = clean_url(raw) if raw else ''
+            if url and is_junk_url(url, placeholder, mime_types):
+                url = ''
+            cleaned[raw] = url
+        return url
+
+    def add(url):
+        if url and url not in seen:
+            seen.add(url)
+            results.append(url)
 
     for entry in url_entries:
         # Filter out useless entries (bare FUZZ with no resolved value)
@@ -121,32 +147,22 @@ def format_output(url_entries, include_templates, placeholder, mime_types=None):
 
         if include_templates:
             # Include ALL URLs: static URLs, original template syntax, AND placeholder versions
-            original = clean_url(entry.get('original', ''))
-            placeholder_val = clean_url(entry.get('placeholder', ''))
-
             if entry.get('has_template', False):
                 # Has template - add BOTH original ({x} syntax) AND placeholder (FUZZ) version
-                if original and not is_junk_url(original, placeholder, mime_types) and original not in results:
-                    results.append(original)
-                if placeholder_val and not is_junk_url(placeholder_val, placeholder, mime_types) and placeholder_val not in results and placeholder_val != original:
-                    results.append(placeholder_val)
-            else:
-                # Static URL - just add it once
-                if placeholder_val and not is_junk_url(placeholder_val, placeholder, mime_types) and placeholder_val not in results:
-                    results.append(placeholder_val)
+                add(clean_and_filter(entry.get('original', '')))
+            # Static URLs are just added once, from the placeholder value
+            add(clean_and_filter(entry.get('placeholder', '')))
         else:
             # Only include static URLs or resolved placeholder versions (no {x} syntax)
             if not entry.get('has_template', False):
                 # Static URL - use as-is
-                output = clean_url(entry.get('resolved', entry.get('original', '')))
-                if output and not is_junk_url(output, placeholder, mime_types) and output not in results:
-                    results.append(output)
+                add(clean_and_filter(entry.get('resolved', entry.get('original', ''))))
             else:
                 # Has template - use placeholder version (with FUZZ), NOT original (with {})
-                placeholder_val = clean_url(entry.get('placeholder', ''))
+                placeholder_val = clean_and_filter(entry.get('placeholder', ''))
 
                 # Only include if we successfully replaced template markers
-                if placeholder_val and '{' not in placeholder_val and not is_junk_url(placeholder_val, placeholder, mime_types) and placeholder_val not in results:
-                    results.append(placeholder_val)
+                if '{' not in placeholder_val:
+                    add(placeholder_val)
 
     return results
@@ -8,6 +8,7 @@ Handles processing of different AST node types to extract URLs:
 - Call expressions (.concat(), .join(), .replace())
 """
 import re
+from functools import lru_cache
 from itertools import product
 
 from sawari.core.url_utils import is_url_pattern, is_path_pattern
@@ -24,6 +25,46 @@ from .aliases import extract_local_aliases
 from .output import convert_route_params
 from .filters import consolidate_adjacent_placeholders
 
+# Pre-compiled regex patterns at module level for performance
+# These run on every string literal, template string and concatenation result
+_PROSE_URL_PATTERN = re.compile(r'https?://[^\s<>"\'{}|\\^`\[\])]+')
+_EMBEDDED_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_TEMPLATE_PARAM_PATTERN = re.compile(r'\{[^}]+\}')
+
+
+@lru_cache(maxsize=16)
+def _repeated_placeholder_patterns(placeholder):
+    """
+    Compiled patterns used to consolidate repeated placeholders, keyed by placeholder.
+
+    Returns:
+    - Tuple of (trailing-char run, placeholder/placeholder, placeholderplaceholder) patterns
+    """
+    escaped = re.escape(placeholder)
+    return (
+        re.compile(f'{escaped}+'),
+        re.compile(f'{escaped}/{escaped}'),
+        re.compile(f'{escaped}{escaped}'),
+    )
+
+
+def _collapse_repeated_placeholders(text, placeholder, pairs=True):
+    """
+    Collapses placeholder runs (FUZZZ, FUZZ/FUZZ and, with pairs, FUZZFUZZ) into one placeholder.
+
+    Every pattern needs the placeholder itself to match, so text without it
+    (static strings, the common case) skips the regex passes entirely.
+    """
+    if placeholder not in text:
+        return text
+
+    run_pattern, slash_pattern, pair_pattern = _repeated_placeholder_patterns(placeholder)
+    text = run_pattern.sub(placeholder, text)
+    text = slash_pattern.sub(placeholder, text)
+    if pairs:
+        text = pair_pattern.sub(placeholder, text)
+    return text
+
 
 def extract_urls_from_prose(text, placeholder='FUZZ'):
     """
@@ -76,8 +117,7 @@ def extract_urls_from_prose(text, placeholder='FUZZ'):
     # - False positives like /ISO from "RFC2822/ISO"
     results = []
 
-    url_pattern = r'https?://[^\s<>"\'{}|\\^`\[\])]+'
-    for match in re.findall(url_pattern, text):
+    for match in _PROSE_URL_PATTERN.findall(text):
         # Clean trailing punctuation
         match = match.rstrip('.,;:')
         if len(match) > 10:  # Skip very short URLs
@@ -171,7 +211,7 @@ def process_string_literal(node, placeholder, symbol_table=None, object_table=No
         if has_params:
             # Has route parameters - treat as template
             # Replace {param} with FUZZ for placeholder version
-            placeholder_text = re.sub(r'\{[^}]+\}', placeholder, converted_text)
+            placeholder_text = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_text)
             return {
                 'original': converted_text,  # Use template syntax {id}
                 'placeholder': placeholder_text,  # Use FUZZ
@@ -188,8 +228,7 @@ def process_string_literal(node, placeholder, symbol_table=None, object_table=No
             }
 
     # Extract embedded URLs using regex
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    matches = re.findall(url_pattern, text)
+    matches = _EMBEDDED_URL_PATTERN.findall(text)
 
     if matches:
         results = []
@@ -207,7 +246,7 @@ def process_string_literal(node, placeholder, symbol_table=None, object_table=No
 
 def process_template_string(node, placeholder, symbol_table=None, object_table=None, array_table=None,
                             alias_table=None, disable_semantic_aliases=False,
-                            html_parser_backend='lxml', traverse_func=None):
+                            html_parser_backend='lxml', traverse_func=None, block_alias_index=None):
     """
     Handles template literals with ${} substitutions.
     Generates all combinations when variables have multiple values.
@@ -246,7 +285,8 @@ def process_template_string(node, placeholder, symbol_table=None, object_table=N
                     variables_in_template.add(base_var)
 
     # Extract local aliases for these variables
-    local_aliases = extract_local_aliases(node, variables_in_template, alias_table, disable_semantic_aliases)
+    local_aliases = extract_local_aliases(node, variables_in_template, alias_table, disable_semantic_aliases,
+                                          block_alias_index)
 
     # Store parts as lists of possible values for generating combinations
     original_parts = []
@@ -367,12 +407,12 @@ def process_template_string(node, placeholder, symbol_table=None, object_table=N
                 # Route params make it a template
                 final_original = converted_original
                 # Replace {param} with FUZZ
-                final_resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+                final_resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
                 final_resolved = consolidate_adjacent_placeholders(final_resolved, placeholder)
             else:
                 # Has template substitutions but no route params
                 final_original = converted_original
-                final_resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+                final_resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
                 final_resolved = consolidate_adjacent_placeholders(final_resolved, placeholder)
 
             entry = {
@@ -389,7 +429,7 @@ def process_template_string(node, placeholder, symbol_table=None, object_table=N
 
 
 def process_binary_expression(node, placeholder, symbol_table=None, object_table=None, array_table=None,
-                              alias_table=None, disable_semantic_aliases=False):
+                              alias_table=None, disable_semantic_aliases=False, block_alias_index=None):
     """
     Handles string concatenation with + operator, .join(), and .replace().
     """
@@ -426,7 +466,8 @@ def process_binary_expression(node, placeholder, symbol_table=None, object_table
         elif n.type == 'template_string':
             # Handle template string in concatenation
             result = process_template_string(n, placeholder, symbol_table, object_table, array_table,
-                                            alias_table, disable_semantic_aliases)
+                                            alias_table, disable_semantic_aliases,
+                                            block_alias_index=block_alias_index)
             if result:
                 return [('template', result)]
             return []
@@ -463,7 +504,8 @@ def process_binary_expression(node, placeholder, symbol_table=None, object_table
                 current = obj_node
 
     # Extract local aliases for variables used in this concatenation
-    local_aliases = extract_local_aliases(node, variables_in_concat, alias_table, disable_semantic_aliases)
+    local_aliases = extract_local_aliases(node, variables_in_concat, alias_table, disable_semantic_aliases,
+                                          block_alias_index)
 
     original_parts = []
     placeholder_parts = []
@@ -558,11 +600,8 @@ def process_binary_expression(node, placeholder, symbol_table=None, object_table
     resolved = ''.join(resolved_parts)
 
     # Consolidate repeated placeholders (including with slashes)
-    placeholder_str = re.sub(f'{re.escape(placeholder)}+', placeholder, placeholder_str)
-    placeholder_str = re.sub(f'{re.escape(placeholder)}/{re.escape(placeholder)}', placeholder, placeholder_str)
-    placeholder_str = re.sub(f'{re.escape(placeholder)}{re.escape(placeholder)}', placeholder, placeholder_str)
-    resolved = re.sub(f'{re.escape(placeholder)}+', placeholder, resolved)
-    resolved = re.sub(f'{re.escape(placeholder)}/{re.escape(placeholder)}', placeholder, resolved)
+    placeholder_str = _collapse_repeated_placeholders(placeholder_str, placeholder)
+    resolved = _collapse_repeated_placeholders(resolved, placeholder, pairs=False)
 
     # Check if the result (placeholder or resolved) is a URL/path pattern
     if (is_url_pattern(original) or is_path_pattern(original) or
@@ -578,8 +617,8 @@ def process_binary_expression(node, placeholder, symbol_table=None, object_table
             has_template = True  # Route params make it a template
             original = converted_original
             # Replace {param} with FUZZ in placeholder/resolved
-            placeholder_str = re.sub(r'\{[^}]+\}', placeholder, converted_placeholder)
-            resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+            placeholder_str = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_placeholder)
+            resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
             # Consolidate adjacent placeholders created by route param replacement (e.g., {t}{i} -> FUZZFUZZ -> FUZZ)
             placeholder_str = consolidate_adjacent_placeholders(placeholder_str, placeholder)
             resolved = consolidate_adjacent_placeholders(resolved, placeholder)
@@ -587,8 +626,8 @@ def process_binary_expression(node, placeholder, symbol_table=None, object_table
             # Has template substitutions but no route params
             # Still need to replace remaining {} patterns and consolidate
             original = converted_original
-            placeholder_str = re.sub(r'\{[^}]+\}', placeholder, converted_placeholder)
-            resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+            placeholder_str = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_placeholder)
+            resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
             placeholder_str = consolidate_adjacent_placeholders(placeholder_str, placeholder)
             resolved = consolidate_adjacent_placeholders(resolved, placeholder)
 
@@ -776,11 +815,8 @@ def process_concat_call(node, placeholder, symbol_table=None, object_table=None,
     resolved = ''.join(resolved_parts)
 
     # Consolidate repeated placeholders in concat results too
-    placeholder_str = re.sub(f'{re.escape(placeholder)}+', placeholder, placeholder_str)
-    placeholder_str = re.sub(f'{re.escape(placeholder)}/{re.escape(placeholder)}', placeholder, placeholder_str)
-    placeholder_str = re.sub(f'{re.escape(placeholder)}{re.escape(placeholder)}', placeholder, placeholder_str)
-    resolved = re.sub(f'{re.escape(placeholder)}+', placeholder, resolved)
-    resolved = re.sub(f'{re.escape(placeholder)}/{re.escape(placeholder)}', placeholder, resolved)
+    placeholder_str = _collapse_repeated_placeholders(placeholder_str, placeholder)
+    resolved = _collapse_repeated_placeholders(resolved, placeholder, pairs=False)
 
     # Check if the result (placeholder or resolved) is a URL/path pattern
     if (is_url_pattern(original) or is_path_pattern(original) or
@@ -796,8 +832,8 @@ def process_concat_call(node, placeholder, symbol_table=None, object_table=None,
             has_template = True  # Route params make it a template
             original = converted_original
             # Replace {param} with FUZZ in placeholder/resolved
-            placeholder_str = re.sub(r'\{[^}]+\}', placeholder, converted_placeholder)
-            resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+            placeholder_str = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_placeholder)
+            resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
             # Consolidate adjacent placeholders created by route param replacement (e.g., {t}{i} -> FUZZFUZZ -> FUZZ)
             placeholder_str = consolidate_adjacent_placeholders(placeholder_str, placeholder)
             resolved = consolidate_adjacent_placeholders(resolved, placeholder)
@@ -805,8 +841,8 @@ def process_concat_call(node, placeholder, symbol_table=None, object_table=None,
             # Has template substitutions but no route params
             # Still need to replace remaining {} patterns and consolidate
             original = converted_original
-            placeholder_str = re.sub(r'\{[^}]+\}', placeholder, converted_placeholder)
-            resolved = re.sub(r'\{[^}]+\}', placeholder, converted_resolved)
+            placeholder_str = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_placeholder)
+            resolved = _TEMPLATE_PARAM_PATTERN.sub(placeholder, converted_resolved)
             placeholder_str = consolidate_adjacent_placeholders(placeholder_str, placeholder)
             resolved = consolidate_adjacent_placeholders(resolved, placeholder)
 
@@ -10,22 +10,41 @@ Handles resolving JavaScript expressions to their values:
 """
 
 
+# Single-character escapes: \n, \t, \\, \', etc.
+_SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r',
+    'b': '\b', 'f': '\f', 'v': '\v',
+    '\\': '\\', "'": "'", '"': '"', '0': '\0'
+}
+
+
 def decode_js_string(text):
     """
     Decode JavaScript string escape sequences to their actual characters.
     Handles: \\xHH, \\uHHHH, \\u{HHHHHH}, \\OOO (octal), \\n, \\t, \\r, etc.
     """
-    if not text:
+    # Most strings have no escapes at all
+    if not text or '\\' not in text:
         return text
 
     result = []
     i = 0
-    while i < len(text):
-        if text[i] == '\\' and i + 1 < len(text):
+    length = len(text)
+    while i < length:
+        # Copy the literal run up to the next backslash as one slice
+        next_escape = text.find('\\', i)
+        if next_escape == -1:
+            result.append(text[i:])
+            break
+        if next_escape > i:
+            result.append(text[i:next_escape])
+            i = next_escape
+
+        if i + 1 < length:
             next_char = text[i + 1]
 
             # Hex escape: \xHH
-            if next_char == 'x' and i + 3 < len(text):
+            if next_char == 'x' and i + 3 < length:
                 try:
                     hex_code = text[i+2:i+4]
                     result.append(chr(int(hex_code, 16)))
@@ -37,7 +56,7 @@ def decode_js_string(text):
             # Unicode escape: \uHHHH
             elif next_char == 'u':
                 # Unicode code point: \u{HHHHHH}
-                if i + 2 < len(text) and text[i+2] == '{':
+                if i + 2 < length and text[i+2] == '{':
                     end = text.find('}', i+3)
                     if end != -1:
                         try:
@@ -48,7 +67,7 @@ def decode_js_string(text):
                         except (ValueError, OverflowError):
                             pass
                 # Standard unicode: \uHHHH
-                elif i + 5 < len(text):
+                elif i + 5 < length:
                     try:
                         unicode_code = text[i+2:i+6]
                         result.append(chr(int(unicode_code, 16)))
@@ -61,7 +80,7 @@ def decode_js_string(text):
             elif next_char.isdigit():
                 octal_str = ''
                 j = i + 1
-                while j < len(text) and j < i + 4 and text[j].isdigit():
+                while j < length and j < i + 4 and text[j].isdigit():
                     octal_str += text[j]
                     j += 1
                 try:
@@ -72,22 +91,14 @@ def decode_js_string(text):
                     pass
 
             # Standard escapes
-            escape_map = {
-                'n': '\n', 't': '\t', 'r': '\r',
-                'b': '\b', 'f': '\f', 'v': '\v',
-                '\\': '\\', "'": "'", '"': '"', '0': '\0'
-            }
-            if next_char in escape_map:
-                result.append(escape_map[next_char])
+            if next_char in _SIMPLE_ESCAPES:
+                result.append(_SIMPLE_ESCAPES[next_char])
                 i += 2
                 continue
 
-            # Unknown escape, keep as-is
-            result.append(text[i])
-            i += 1
-        else:
-            result.append(text[i])
-            i += 1
+        # Unknown escape (or trailing backslash), keep as-is
+        result.append(text[i])
+        i += 1
 
     return ''.join(result)
 
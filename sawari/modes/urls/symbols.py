@@ -14,6 +14,7 @@ from .resolvers import (
     resolve_join_call,
     resolve_replace_call,
 )
+from .config import LEAF_NODE_TYPES
 from .aliases import (
     extract_aliases_from_object,
     scan_sibling_nodes_for_aliases,
@@ -59,11 +60,8 @@ def collect_array_elements(node, array_name, placeholder, symbol_table, object_t
 def collect_object_properties(node, obj_name, placeholder, symbol_table, object_table, array_table, alias_table=None):
     """
     Recursively processes object literals and populates object_table.
-    Also extracts semantic aliases from property-value pairs.
+    Also extracts semantic aliases from property-value pairs unless alias_table is None.
     """
-    if alias_table is None:
-        alias_table = {}
-
     if node.type != 'object':
         return
 
@@ -71,7 +69,8 @@ def collect_object_properties(node, obj_name, placeholder, symbol_table, object_
         object_table[obj_name] = {}
 
     # Extract aliases from this object literal
-    extract_aliases_from_object(node, alias_table=alias_table)
+    if alias_table is not None:
+        extract_aliases_from_object(node, alias_table=alias_table)
 
     for child in node.named_children:
         if child.type == 'pair':
@@ -211,13 +210,10 @@ def collect_variable_assignment(node, placeholder, symbol_table, object_table, a
     - symbol_table: Dictionary mapping variable names to value lists
     - object_table: Dictionary mapping object names to property structures
     - array_table: Dictionary mapping array names to element lists
-    - alias_table: Dictionary for semantic aliases
+    - alias_table: Dictionary for semantic aliases (None skips alias scanning)
     - context: Parsed context dictionary (external variable definitions)
     - context_policy: How to handle context/file collisions ('merge', 'override', 'only')
     """
-    if alias_table is None:
-        alias_table = {}
-
     var_name = None
     value_node = None
     parent_node = None
@@ -227,8 +223,9 @@ def collect_variable_assignment(node, placeholder, symbol_table, object_table, a
         value_node = node.child_by_field_name('value')
         if name_node:
             var_name = name_node.text.decode('utf8')
-        # Get parent to scan siblings
-        parent_node = node.parent
+        # Get parent to scan siblings (only needed when collecting aliases)
+        if alias_table is not None:
+            parent_node = node.parent
     elif node.type == 'assignment_expression':
         left_node = node.child_by_field_name('left')
         if left_node and left_node.type == 'identifier':
@@ -305,7 +302,7 @@ def build_symbol_table(node, placeholder, symbol_table, object_table, array_tabl
                        node_visit_count=None, max_nodes_limit=1000000):
     """
     First pass - iteratively traverses AST to collect variable assignments
-    and build object structures using explicit stack.
+    and build object structures using a TreeCursor.
 
     This iterative approach eliminates recursion overhead and avoids stack overflow
     on very deep ASTs.
@@ -316,7 +313,7 @@ def build_symbol_table(node, placeholder, symbol_table, object_table, array_tabl
     - symbol_table: Dictionary mapping variable names to value lists
     - object_table: Dictionary mapping object names to property structures
     - array_table: Dictionary mapping array names to element lists
-    - alias_table: Dictionary for semantic aliases
+    - alias_table: Dictionary for semantic aliases (None skips alias scanning)
     - context: Parsed context dictionary (external variable definitions)
     - context_policy: How to handle context/file collisions ('merge', 'override', 'only')
     - node_visit_count: Mutable list [count] for tracking visits
@@ -325,42 +322,57 @@ def build_symbol_table(node, placeholder, symbol_table, object_table, array_tabl
     Returns:
     - Updated node_visit_count[0]
     """
-    if alias_table is None:
-        alias_table = {}
     if node_visit_count is None:
         node_visit_count = [0]
 
-    # Use explicit stack for iterative traversal
-    stack = [node]
-
-    while stack:
-        if node_visit_count[0] > max_nodes_limit:
-            sys.stderr.write(f'\nWarning: Stopped after visiting {max_nodes_limit:,} nodes. File may be too large or complex.\n')
-            break
-
-        current_node = stack.pop()
-        node_visit_count[0] += 1
-        node_type = current_node.type
-
-        if node_type in ('lexical_declaration', 'variable_declaration'):
-            for child in current_node.named_children:
-                if child.type == 'variable_declarator':
-                    collect_variable_assignment(
-                        child, placeholder, symbol_table, object_table, array_table,
-                        alias_table, context, context_policy
-                    )
-        elif node_type == 'assignment_expression':
-            left_node = current_node.child_by_field_name('left')
-            if left_node:
-                if left_node.type == 'identifier':
-                    collect_variable_assignment(
-                        current_node, placeholder, symbol_table, object_table, array_table,
-                        alias_table, context, context_policy
-                    )
-                elif left_node.type == 'member_expression':
-                    collect_object_assignment(current_node, placeholder, symbol_table, object_table, array_table)
-
-        # Add children to stack (reverse for left-to-right processing order)
-        stack.extend(reversed(current_node.named_children))
+    # Walk named nodes in pre-order with a TreeCursor (no per-node child lists)
+    cursor = node.walk()
+    reached_end = False
+
+    while not reached_end:
+        current_node = cursor.node
+
+        if current_node.is_named:
+            if node_visit_count[0] > max_nodes_limit:
+                sys.stderr.write(f'\nWarning: Stopped after visiting {max_nodes_limit:,} nodes. File may be too large or complex.\n')
+                break
+
+            node_visit_count[0] += 1
+            node_type = current_node.type
+
+            if node_type in ('lexical_declaration', 'variable_declaration'):
+                for child in current_node.named_children:
+                    if child.type == 'variable_declarator':
+                        collect_variable_assignment(
+                            child, placeholder, symbol_table, object_table, array_table,
+                            alias_table, context, context_policy
+                        )
+            elif node_type == 'assignment_expression':
+                left_node = current_node.child_by_field_name('left')
+                if left_node:
+                    if left_node.type == 'identifier':
+                        collect_variable_assignment(
+                            current_node, placeholder, symbol_table, object_table, array_table,
+                            alias_table, context, context_policy
+                        )
+                    elif left_node.type == 'member_expression':
+                        collect_object_assignment(current_node, placeholder, symbol_table, object_table, array_table)
+
+            # Descend into children first (left-to-right processing order).
+            # Leaf children are skipped but still counted toward max_nodes_limit.
+            if node_type in LEAF_NODE_TYPES:
+                node_visit_count[0] += current_node.named_child_count
+                # Warn as a full walk would have on reaching a child past the limit
+                if node_visit_count[0] > max_nodes_limit + 1:
+                    sys.stderr.write(f'\nWarning: Stopped after visiting {max_nodes_limit:,} nodes. File may be too large or complex.\n')
+                    break
+            elif cursor.goto_first_child():
+                continue
+
+        # Move to the next sibling, climbing back up until one exists
+        while not cursor.goto_next_sibling():
+            if not cursor.goto_parent():
+                reached_end = True
+                break
 
     return node_visit_count[0]
@@ -8,6 +8,7 @@ import re
 from sawari.core.jsparser import parse_javascript
 from sawari.core.url_utils import is_url_pattern, is_path_pattern
 
+from .config import LEAF_NODE_TYPES
 from .filters import clean_unbalanced_brackets, clean_trailing_sentence_punctuation, is_junk_url
 from .processors import (
     process_string_literal,
@@ -17,6 +18,12 @@ from .processors import (
     process_call_expression,
 )
 
+# Pre-compiled regex patterns for URLs and paths mentioned in comments
+_COMMENT_URL_PATTERN = re.compile(r'https?://[^\s<>"{}|\\^`\[\]]+')
+_COMMENT_PATH_PATTERN = re.compile(
+    r'(?:^|[\s,;])((?:/[a-zA-Z0-9_\-./{}:]+)|(?:\./[a-zA-Z0-9_\-./]+)|(?:\.\./[a-zA-Z0-9_\-./]+))'
+)
+
 
 def add_url_entry(entry, url_entries, seen_urls, verbose=False, placeholder='FUZZ', mime_types=None):
     """
@@ -90,12 +97,10 @@ def process_comments(node, placeholder, verbose, url_entries, seen_urls,
     found_urls = []
 
     # Match full URLs
-    url_pattern = r'https?://[^\s<>"{}|\\^`\[\]]+'
-    found_urls.extend(re.findall(url_pattern, text))
+    found_urls.extend(_COMMENT_URL_PATTERN.findall(text))
 
     # Match path patterns
-    path_pattern = r'(?:^|[\s,;])((?:/[a-zA-Z0-9_\-./{}:]+)|(?:\./[a-zA-Z0-9_\-./]+)|(?:\.\./[a-zA-Z0-9_\-./]+))'
-    found_paths = re.findall(path_pattern, text)
+    found_paths = _COMMENT_PATH_PATTERN.findall(text)
     found_urls.extend(found_paths)
 
     # Add found URLs as entries
@@ -135,7 +140,7 @@ def traverse_node(node, placeholder, verbose, url_entries, seen_urls,
                   disable_semantic_aliases=False, node_visit_count=None,
                   max_nodes_limit=1000000):
     """
-    Second pass - iteratively traverses AST to extract URLs using explicit stack.
+    Second pass - iteratively traverses AST to extract URLs using a TreeCursor.
 
     This iterative approach eliminates recursion overhead and avoids stack overflow
     on very deep ASTs.
@@ -167,9 +172,6 @@ def traverse_node(node, placeholder, verbose, url_entries, seen_urls,
     if node_visit_count is None:
         node_visit_count = [0]
 
-    # Use explicit stack for iterative traversal
-    stack = [node]
-
     # Create a traverse function for nested calls (e.g., processing HTML inline scripts)
     def traverse_func(n, ph, v):
         traverse_node(
@@ -179,57 +181,103 @@ def traverse_node(node, placeholder, verbose, url_entries, seen_urls,
             disable_semantic_aliases, node_visit_count, max_nodes_limit
         )
 
-    while stack:
-        if node_visit_count[0] > max_nodes_limit:
-            break
+    # Alias candidates per enclosing block, shared by every template string and
+    # concatenation in this tree so each block is scanned at most once
+    block_alias_index = None if disable_semantic_aliases else {}
 
-        current_node = stack.pop()
-        node_visit_count[0] += 1
-
-        # Process current node
-        result = None
-        node_type = current_node.type
+    # Node handlers keyed by tree-sitter node type. Every other node type is a
+    # single dict miss instead of a walk down an if/elif ladder of string compares.
+    def handle_string(n):
+        return process_string_literal(
+            n, placeholder, symbol_table, object_table, array_table,
+            html_parser_backend, traverse_func
+        )
 
-        if node_type == 'string':
-            result = process_string_literal(
-                current_node, placeholder, symbol_table, object_table, array_table,
-                html_parser_backend, traverse_func
-            )
-        elif node_type == 'template_string':
-            result = process_template_string(
-                current_node, placeholder, symbol_table, object_table, array_table,
-                alias_table, disable_semantic_aliases, html_parser_backend, traverse_func
-            )
-        elif node_type == 'binary_expression':
-            result = process_binary_expression(
-                current_node, placeholder, symbol_table, object_table, array_table,
-                alias_table, disable_semantic_aliases
-            )
-        elif node_type == 'call_expression':
-            # Check for .concat(), .join(), or .replace()
-            func_node = current_node.child_by_field_name('function')
-            if func_node and func_node.type == 'member_expression':
-                prop = func_node.child_by_field_name('property')
-                if prop:
-                    method_name = prop.text.decode('utf8')
-                    if method_name == 'concat':
-                        result = process_concat_call(
-                            current_node, placeholder, symbol_table, object_table, array_table,
-                            alias_table, disable_semantic_aliases
-                        )
-                    elif method_name in ('join', 'replace'):
-                        result = process_call_expression(
-                            current_node, placeholder, symbol_table, object_table, array_table
-                        )
-        elif node_type in ('comment', 'hash_bang_line'):
-            process_comments(
-                current_node, placeholder, verbose, url_entries, seen_urls,
-                symbol_table, object_table, array_table, alias_table,
-                mime_types, html_parser_backend, disable_semantic_aliases, max_nodes_limit
-            )
+    def handle_template_string(n):
+        return process_template_string(
+            n, placeholder, symbol_table, object_table, array_table,
+            alias_table, disable_semantic_aliases, html_parser_backend, traverse_func,
+            block_alias_index
+        )
 
-        if result:
-            add_url_entry(result, url_entries, seen_urls, verbose, placeholder, mime_types)
+    def handle_binary_expression(n):
+        return process_binary_expression(
+            n, placeholder, symbol_table, object_table, array_table,
+            alias_table, disable_semantic_aliases, block_alias_index
+        )
 
-        # Add children to stack (reverse for left-to-right processing order)
-        stack.extend(reversed(current_node.named_children))
+    def handle_call_expression(n):
+        # Check for .concat(), .join(), or .replace()
+        func_node = n.child_by_field_name('function')
+        if func_node and func_node.type == 'member_expression':
+            prop = func_node.child_by_field_name('property')
+            if prop:
+                method_name = prop.text.decode('utf8')
+                if method_name == 'concat':
+                    return process_concat_call(
+                        n, placeholder, symbol_table, object_table, array_table,
+                        alias_table, disable_semantic_aliases
+                    )
+                elif method_name in ('join', 'replace'):
+                    return process_call_expression(
+                        n, placeholder, symbol_table, object_table, array_table
+                    )
+        return None
+
+    def handle_comment(n):
+        process_comments(
+            n, placeholder, verbose, url_entries, seen_urls,
+            symbol_table, object_table, array_table, alias_table,
+            mime_types, html_parser_backend, disable_semantic_aliases, max_nodes_limit
+        )
+        return None
+
+    node_handlers = {
+        'string': handle_string,
+        'template_string': handle_template_string,
+        'binary_expression': handle_binary_expression,
+        'call_expression': handle_call_expression,
+        'comment': handle_comment,
+        'hash_bang_line': handle_comment,
+    }
+
+    # Walk named nodes in pre-order with a TreeCursor: no per-node child lists
+    # are allocated, and anonymous tokens (punctuation, keywords) are skipped.
+    # Every named node is counted toward max_nodes_limit, which a Query over
+    # just the handled node types could not do.
+    cursor = node.walk()
+    goto_first_child = cursor.goto_first_child
+    goto_next_sibling = cursor.goto_next_sibling
+    goto_parent = cursor.goto_parent
+    get_handler = node_handlers.get
+    reached_end = False
+
+    while not reached_end:
+        current_node = cursor.node
+
+        if current_node.is_named:
+            if node_visit_count[0] > max_nodes_limit:
+                break
+
+            node_visit_count[0] += 1
+            node_type = current_node.type
+
+            # Process current node
+            handler = get_handler(node_type)
+            if handler is not None:
+                result = handler(current_node)
+                if result:
+                    add_url_entry(result, url_entries, seen_urls, verbose, placeholder, mime_types)
+
+            # Descend into children first (left-to-right processing order).
+            # Leaf children are skipped but still counted toward max_nodes_limit.
+            if node_type in LEAF_NODE_TYPES:
+                node_visit_count[0] += current_node.named_child_count
+            elif goto_first_child():
+                continue
+
+        # Move to the next sibling, climbing back up until one exists
+        while not goto_next_sibling():
+            if not goto_parent():
+                reached_end = True
+                break
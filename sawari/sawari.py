@@ -17,7 +17,9 @@ def main():
         sys.exit(1)
 
     args = parse_arguments()
-    language, root_node = parse_javascript(args.javascript)
+    # Encode once: the parser and the urls file size check both use the UTF-8 bytes
+    source = args.javascript.encode('utf8')
+    language, root_node = parse_javascript(source)
 
     if args.mode == 'urls':
         result = get_urls(
@@ -25,7 +27,7 @@ def main():
             args.placeholder,
             args.include_templates,
             args.verbose,
-            len(args.javascript),
+            len(source),
             args.max_nodes,
             args.max_file_size,
             args.html_parser,
@@ -0,0 +1,127 @@
+"""
+Shared pytest fixtures.
+
+Fixtures here hold no mutable state visible to tests, so test modules stay
+independent and can be distributed across workers (e.g. ``pytest -n auto``
+with pytest-xdist). Each worker builds its own session fixtures; tree-sitter
+objects are never shared between processes.
+
+Fixture files stay on disk as the single source of truth: each one is read
+with one read_bytes() call and parsed once per session, so tests never touch
+the filesystem again and never decode/re-encode the source.
+"""
+
+import pytest
+
+from pathlib import Path
+from sawari.core.jsparser import parse_javascript
+from sawari.modes.urls import get_urls
+
+
+# Path to URL test fixtures (shared by the test_urls*.py modules)
+FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'urls'
+
+# Fixture filename -> path, listed once at import
+FIXTURE_PATHS = {path.name: path for path in FIXTURES_DIR.glob('*.js')}
+
+# HTML-in-JavaScript fixtures (test_urls_html.py)
+HTML_FIXTURE_PATHS = {path.name: path for path in (FIXTURES_DIR.parent / 'html').glob('*.js')}
+
+
+def pytest_generate_tests(metafunc):
+    # Tests taking a url_fixture argument run once per URL fixture file
+    if 'url_fixture' in metafunc.fixturenames:
+        metafunc.parametrize('url_fixture', sorted(FIXTURE_PATHS))
+
+
+@pytest.fixture(scope='session', autouse=True)
+def _warm_parser():
+    """Pay one-time grammar loading before the first test so durations reflect steady state."""
+    parse_javascript('var _ = 0;')
+
+
+def parse_fixtures(paths):
+    """Parse fixture files up front; returns {filename: (root_node, file_size)}.
+
+    Parsed trees are kept in memory only: tree-sitter trees cannot be pickled,
+    and re-parsing the small fixtures is cheaper than any on-disk cache.
+    """
+    parsed = {}
+    for filename, path in paths.items():
+        content = path.read_bytes()
+        _, root_node = parse_javascript(content)
+        parsed[filename] = (root_node, len(content))
+    return parsed
+
+
+@pytest.fixture(scope='session')
+def parsed_fixture():
+    """Parse each URL fixture once per session; returns (root_node, file_size)."""
+    cache = parse_fixtures(FIXTURE_PATHS)
+
+    def _get(filename):
+        return cache[filename]
+
+    return _get
+
+
+@pytest.fixture(scope='session')
+def parsed_html():
+    """Parse each HTML fixture once per session; returns the root node."""
+    cache = parse_fixtures(HTML_FIXTURE_PATHS)
+
+    def _get(filename):
+        return cache[filename][0]
+
+    return _get
+
+
+@pytest.fixture(scope='session')
+def html_urls_for(parsed_html):
+    """Run get_urls once per (HTML fixture, options); returns a frozenset of URLs."""
+    cache = {}
+
+    def _urls(filename, **options):
+        key = (filename, frozenset(options.items()))
+        if key not in cache:
+            cache[key] = frozenset(get_urls(parsed_html(filename), 'FUZZ', False, False, **options))
+        return cache[key]
+
+    return _urls
+
+
+@pytest.fixture(scope='session')
+def has_url_with():
+    """Returns a check that one URL in a result contains every given substring."""
+    def _check(urls, *parts):
+        return any(all(part in url for part in parts) for url in urls)
+
+    return _check
+
+
+@pytest.fixture(scope='session')
+def large_js_tree():
+    """A ~1.3MB generated source (over the 1MB large-file threshold), parsed once; returns (root_node, file_size)."""
+    source = b"const url = '/api/users';\n" * 50000
+    _, root_node = parse_javascript(source)
+    return root_node, len(source)
+
+
+@pytest.fixture(scope='session')
+def urls_for(parsed_fixture):
+    """Run get_urls once per (fixture, include_templates, placeholder, options); returns a frozenset of URLs.
+
+    Extra keyword options (skip_symbols, file_size, extensions, ...) are passed
+    to get_urls, so tests that repeat a flag combination share one run.
+    """
+    cache = {}
+
+    def _urls(filename, include_templates=False, placeholder='FUZZ', **options):
+        key = (filename, include_templates, placeholder, frozenset(options.items()))
+        if key not in cache:
+            node, file_size = parsed_fixture(filename)
+            options.setdefault('file_size', file_size)
+            cache[key] = frozenset(get_urls(node, placeholder, include_templates, False, **options))
+        return cache[key]
+
+    return _urls
@@ -0,0 +1,21 @@
+const base = "/api";
+const version = "v2";
+
+// Template with route params
+const userRoute = `/users/:id`;
+
+// Concatenation with array join
+const parts = [base, version];
+const url1 = parts.join("") + "/data";
+
+// Chained concat with replace
+const template = "{env}".concat("/resource");
+const url2 = template.replace("{env}", "prod");
+
+// Nested object with concatenation
+const config = {
+    api: {
+        endpoint: base + "/" + version
+    }
+};
+const url3 = config.api.endpoint + "/users";
@@ -0,0 +1 @@
+const x = 123; const y = 'hello';
@@ -98,7 +98,7 @@ class TestExtractUrlsFromHtml:
         '''
         urls = extract_urls_from_html(html)
         assert len(urls) == 3
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/page1' in originals
         assert '/page2' in originals
         assert 'https://example.com/image.png' in originals
@@ -131,7 +131,7 @@ class TestExtractUrlsFromHtml:
         html = '<video src="/video.mp4" poster="/poster.jpg"></video>'
         urls = extract_urls_from_html(html)
         assert len(urls) == 2
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/video.mp4' in originals
         assert '/poster.jpg' in originals
 
@@ -139,7 +139,7 @@ class TestExtractUrlsFromHtml:
         html = '<img srcset="small.jpg 100w, large.jpg 200w">'
         urls = extract_urls_from_html(html)
         assert len(urls) == 2
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert 'small.jpg' in originals
         assert 'large.jpg' in originals
 
@@ -149,7 +149,7 @@ class TestExtractUrlsFromHtml:
         '''
         urls = extract_urls_from_html(html)
         assert len(urls) == 2
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/lazy-load.jpg' in originals
         assert '/api/endpoint' in originals
 
@@ -184,7 +184,7 @@ class TestExtractUrlsFromHtml:
         html = '<object data="/app.swf" codebase="/base/"></object>'
         urls = extract_urls_from_html(html)
         assert len(urls) == 2
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/app.swf' in originals
         assert '/base/' in originals
 
@@ -350,7 +350,7 @@ class TestIntegrationScenarios:
         scripts = extract_inline_scripts_from_html(html)
 
         # Should extract all URLs from attributes
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/css/styles.css' in originals
         assert '/js/analytics.js' in originals
         assert '/page1' in originals
@@ -371,6 +371,6 @@ class TestIntegrationScenarios:
         </div>
         '''
         urls = extract_urls_from_html(html)
-        originals = [u['original'] for u in urls]
+        originals = {u['original'] for u in urls}
         assert '/nested1' in originals
         assert '/nested-img.png' in originals
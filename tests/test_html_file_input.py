@@ -6,18 +6,18 @@ Tests that sawari correctly detects HTML content and extracts URLs from:
 - Inline JavaScript in <script> tags
 """
 
-from tree_sitter import Parser, Language
-import tree_sitter_javascript
+import pytest
 
+from functools import lru_cache
+
+from sawari.core.jsparser import parse_javascript
 from sawari.modes.urls import get_urls, is_html_content
 
 
+@lru_cache(maxsize=128)
 def parse_js(code):
-    """Helper to parse JavaScript code."""
-    JS_LANGUAGE = Language(tree_sitter_javascript.language())
-    parser = Parser(JS_LANGUAGE)
-    tree = parser.parse(bytes(code, 'utf8'))
-    return tree.root_node
+    """Helper to parse JavaScript code (cached, trees are read-only)."""
+    return parse_javascript(code)[1]
 
 
 class TestIsHtmlContent:
@@ -193,7 +193,8 @@ class TestHtmlFileUrlExtraction:
         result = get_urls(node, 'FUZZ', False, False, source_text=html)
 
         # Should appear only once despite being in both HTML and script
-        assert result.count('/api/data') == 1
+        assert '/api/data' in result
+        assert len(result) == len(set(result))
 
     def test_html_with_malformed_script(self):
         """Should handle malformed inline scripts gracefully."""
@@ -275,88 +276,127 @@ class TestHtmlFileUrlExtraction:
         assert '/users/XXX' in result or any('XXX' in url for url in result)
 
 
+# One snippet per TestPathPatternFalsePositives case, each extracted on its own
+NATURAL_LANGUAGE_JS = '''
+var msg = "This isn't a secret; why does it say that?!";
+var question = "What's the meaning of life?";
+'''
+
+QUERY_STRING_JS = '''
+var url1 = "ABC?q=SessionDataQuery";
+var url2 = "/api?key=123";
+var url3 = "example.com?param=value";
+'''
+
+SPACED_QUESTION_JS = '''
+var msg = "How are you doing today?";
+var valid = "api?query=test";
+'''
+
+SPECIAL_CHARS_JS = '''
+var text1 = "Hello, world!";
+var text2 = "What's happening?";
+var text3 = "Email: test@example.com";
+var valid = "/path/to/resource";
+'''
+
+DOMAIN_QUERY_JS = '''
+var url1 = "api.example.com?key=value";
+var url2 = "cdn.site.com?v=123";
+'''
+
+SHORT_WORD_JS = '''
+var short = "a?b";
+var valid = "abc?query=1";
+'''
+
+
+@pytest.fixture(scope='module')
+def natural_language_urls():
+    """URLs of NATURAL_LANGUAGE_JS, extracted once per module."""
+    return get_urls(parse_js(NATURAL_LANGUAGE_JS), 'FUZZ', False, False)
+
+
+@pytest.fixture(scope='module')
+def query_string_urls():
+    """URLs of QUERY_STRING_JS, extracted once per module."""
+    return get_urls(parse_js(QUERY_STRING_JS), 'FUZZ', False, False)
+
+
+@pytest.fixture(scope='module')
+def spaced_question_urls():
+    """URLs of SPACED_QUESTION_JS, extracted once per module."""
+    return get_urls(parse_js(SPACED_QUESTION_JS), 'FUZZ', False, False)
+
+
+@pytest.fixture(scope='module')
+def special_chars_urls():
+    """URLs of SPECIAL_CHARS_JS, extracted once per module."""
+    return get_urls(parse_js(SPECIAL_CHARS_JS), 'FUZZ', False, False)
+
+
+@pytest.fixture(scope='module')
+def domain_query_urls():
+    """URLs of DOMAIN_QUERY_JS, extracted once per module."""
+    return get_urls(parse_js(DOMAIN_QUERY_JS), 'FUZZ', False, False)
+
+
+@pytest.fixture(scope='module')
+def short_word_urls():
+    """URLs of SHORT_WORD_JS, extracted once per module."""
+    return get_urls(parse_js(SHORT_WORD_JS), 'FUZZ', False, False)
+
+
 class TestPathPatternFalsePositives:
     """Test that path pattern detection doesn't produce false positives."""
 
-    def test_rejects_natural_language_with_question_mark(self):
+    def test_rejects_natural_language_with_question_mark(self, natural_language_urls):
         """Should not treat natural language questions as URLs."""
-        js = '''
-        var msg = "This isn't a secret; why does it say that?!";
-        var question = "What's the meaning of life?";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = natural_language_urls
 
         # Should not include natural language strings
         assert "This isn't a secret; why does it say that?!" not in result
         assert "What's the meaning of life?" not in result
 
-    def test_accepts_valid_query_strings(self):
+    def test_accepts_valid_query_strings(self, query_string_urls):
         """Should accept valid URLs with query strings."""
-        js = '''
-        var url1 = "ABC?q=SessionDataQuery";
-        var url2 = "/api?key=123";
-        var url3 = "example.com?param=value";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = query_string_urls
 
         assert 'ABC?q=SessionDataQuery' in result
         assert '/api?key=123' in result
         assert 'example.com?param=value' in result
 
-    def test_rejects_strings_with_spaces_before_question(self):
+    def test_rejects_strings_with_spaces_before_question(self, spaced_question_urls):
         """Should reject strings with spaces before question mark."""
-        js = '''
-        var msg = "How are you doing today?";
-        var valid = "api?query=test";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = spaced_question_urls
 
         assert "How are you doing today?" not in result
         assert "api?query=test" in result
 
-    def test_rejects_strings_with_special_chars(self):
+    def test_rejects_strings_with_special_chars(self, special_chars_urls):
         """Should reject strings with special characters that indicate text."""
-        js = '''
-        var text1 = "Hello, world!";
-        var text2 = "What's happening?";
-        var text3 = "Email: test@example.com";
-        var valid = "/path/to/resource";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = special_chars_urls
 
         assert "Hello, world!" not in result
         assert "What's happening?" not in result
         assert '/path/to/resource' in result
 
-    def test_accepts_domains_with_query_params(self):
+    def test_accepts_domains_with_query_params(self, domain_query_urls):
         """Should accept domain patterns with query parameters."""
-        js = '''
-        var url1 = "api.example.com?key=value";
-        var url2 = "cdn.site.com?v=123";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = domain_query_urls
 
         assert 'api.example.com?key=value' in result
         assert 'cdn.site.com?v=123' in result
 
-    def test_rejects_single_words_with_question(self):
+    def test_rejects_single_words_with_question(self, short_word_urls):
         """Should reject short single words before question marks."""
-        js = '''
-        var short = "a?b";
-        var valid = "abc?query=1";
-        '''
-        node = parse_js(js)
-        result = get_urls(node, 'FUZZ', False, False)
+        result = short_word_urls
 
         # Short patterns might be rejected or accepted depending on length rules
         # Valid patterns with proper structure should work
         assert "abc?query=1" in result
 
+
 class TestHtmlCommentExtraction:
     """Test URL extraction from HTML comments."""
 
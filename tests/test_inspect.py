@@ -83,5 +83,5 @@ def test_inspect_no_duplicates():
     result = inspect_nodes(root_node, False, ['string'])
 
     # Should only have unique values
-    hello_count = result.count('hello')
-    assert hello_count == 1
+    assert 'hello' in result
+    assert len(result) == len(set(result))
@@ -1,4 +1,6 @@
-from sawari.core.jsparser import parse_javascript
+import threading
+
+from sawari.core.jsparser import get_parser, parse_javascript
 
 
 def test_parse_simple_javascript():
@@ -53,3 +55,30 @@ def test_parse_template_string():
 
     assert root_node.type == 'program'
     assert len(root_node.children) > 0
+
+
+def test_parse_bytes():
+    """Test parsing UTF-8 bytes gives the same tree as str"""
+    code = "const url = '/api/ü';"
+    _, str_root = parse_javascript(code)
+    _, bytes_root = parse_javascript(code.encode('utf8'))
+
+    assert bytes_root.type == 'program'
+    assert str(bytes_root) == str(str_root)
+
+
+def test_parser_reused_per_thread():
+    """Test each thread reuses one parser and earlier trees stay valid"""
+    _, first_root = parse_javascript("const a = '/first';")
+    _, second_root = parse_javascript("const b = '/second';")
+
+    assert get_parser() is get_parser()
+    assert first_root.text == b"const a = '/first';"
+    assert second_root.text == b"const b = '/second';"
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(get_parser()))
+    thread.start()
+    thread.join()
+
+    assert other[0] is not get_parser()
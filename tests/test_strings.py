@@ -84,9 +84,9 @@ def test_get_strings_no_duplicates():
     _, root_node = parse_javascript(code)
     result = get_strings(root_node, None, None, False)
 
-    # Count occurrences of "hello"
-    hello_count = result.count('hello')
-    assert hello_count == 1
+    # "hello" is present and nothing is repeated
+    assert 'hello' in result
+    assert len(result) == len(set(result))
 
 
 def test_get_strings_empty_code():
@@ -7,29 +7,25 @@ Covers:
 - JavaScript escape sequence decoding
 """
 
-import os
 import pytest
 
-from sawari.core.jsparser import parse_javascript
 from sawari.modes.urls import (
-    get_urls,
     clean_trailing_sentence_punctuation,
     consolidate_adjacent_placeholders,
     is_junk_url,
 )
 
 
-# Path to test fixtures
-FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'urls')
-
-
-def parse_file(filename):
-    """Helper to parse a JavaScript file from fixtures."""
-    filepath = os.path.join(FIXTURES_DIR, filename)
-    with open(filepath, 'r') as f:
-        content = f.read()
-    _, root_node = parse_javascript(content)
-    return root_node, len(content.encode('utf8'))
+# (input, placeholder, expected) cases for consolidate_adjacent_placeholders
+CONSOLIDATE_PLACEHOLDER_CASES = [
+    ('FUZZFUZZ', 'FUZZ', 'FUZZ'),
+    ('FUZZ/FUZZFUZZ', 'FUZZ', 'FUZZ/FUZZ'),
+    ('FUZZ/spaces/FUZZFUZZ', 'FUZZ', 'FUZZ/spaces/FUZZ'),
+    ('FUZZ/FUZZ/FUZZ/FUZZ/FUZZFUZZ', 'FUZZ', 'FUZZ/FUZZ/FUZZ/FUZZ/FUZZ'),
+    # Custom placeholder
+    ('CUSTOMCUSTOM', 'CUSTOM', 'CUSTOM'),
+    ('CUSTOM/api/CUSTOMCUSTOM', 'CUSTOM', 'CUSTOM/api/CUSTOM'),
+]
 
 
 class TestTrailingSentencePunctuation:
@@ -59,6 +55,12 @@ class TestTrailingSentencePunctuation:
         """Version numbers like LICENSE-2.0 should be preserved."""
         assert clean_trailing_sentence_punctuation('http://example.com/LICENSE-2.0') == 'http://example.com/LICENSE-2.0'
 
+    def test_punctuation_after_extension_removed(self):
+        """Sentence punctuation after a file extension or version should be removed."""
+        assert clean_trailing_sentence_punctuation('http://example.com/file.html.') == 'http://example.com/file.html'
+        assert clean_trailing_sentence_punctuation('http://example.com/LICENSE-2.0.') == 'http://example.com/LICENSE-2.0'
+        assert clean_trailing_sentence_punctuation('http://example.com/path/.,') == 'http://example.com/path/'
+
     def test_edge_cases(self):
         """Edge cases should be handled gracefully."""
         assert clean_trailing_sentence_punctuation('') == ''
@@ -69,37 +71,37 @@ class TestTrailingSentencePunctuation:
 class TestAdjacentPlaceholders:
     """Test handling of adjacent template expressions without separators."""
 
-    def test_adjacent_template_expressions(self):
-        node, file_size = parse_file('adjacent_placeholders.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_adjacent_template_expressions(self, urls_for):
+        urls = urls_for('adjacent_placeholders.js', include_templates=True)
 
         # Should consolidate adjacent placeholders
-        assert 'FUZZ/spaces/FUZZ' in urls
-        assert '{prefix}/spaces/{key}{suffix ? `/${suffix}` : ""}' in urls
+        assert {
+            'FUZZ/spaces/FUZZ',
+            '{prefix}/spaces/{key}{suffix ? `/${suffix}` : ""}',
+        } <= urls
 
         # Should NOT include pure placeholder paths (filtered as junk)
         assert 'FUZZ/FUZZ' not in urls
         assert 'FUZZ/FUZZ/FUZZ/FUZZ/FUZZ' not in urls
 
-    def test_consolidate_adjacent_placeholders_function(self):
+    @pytest.mark.parametrize('value,placeholder,expected', CONSOLIDATE_PLACEHOLDER_CASES)
+    def test_consolidate_adjacent_placeholders_function(self, value, placeholder, expected):
         # Test the helper function directly
-        assert consolidate_adjacent_placeholders('FUZZFUZZ', 'FUZZ') == 'FUZZ'
-        assert consolidate_adjacent_placeholders('FUZZ/FUZZFUZZ', 'FUZZ') == 'FUZZ/FUZZ'
-        assert consolidate_adjacent_placeholders('FUZZ/spaces/FUZZFUZZ', 'FUZZ') == 'FUZZ/spaces/FUZZ'
-        assert consolidate_adjacent_placeholders('FUZZ/FUZZ/FUZZ/FUZZ/FUZZFUZZ', 'FUZZ') == 'FUZZ/FUZZ/FUZZ/FUZZ/FUZZ'
+        assert consolidate_adjacent_placeholders(value, placeholder) == expected
 
-        # Test with custom placeholder
-        assert consolidate_adjacent_placeholders('CUSTOMCUSTOM', 'CUSTOM') == 'CUSTOM'
-        assert consolidate_adjacent_placeholders('CUSTOM/api/CUSTOMCUSTOM', 'CUSTOM') == 'CUSTOM/api/CUSTOM'
+    def test_consolidate_adjacent_placeholders_idempotent(self):
+        # Consolidated output has no adjacent placeholders left to merge
+        value, placeholder, _ = max(CONSOLIDATE_PLACEHOLDER_CASES, key=lambda case: len(case[0]))
+        once = consolidate_adjacent_placeholders(value, placeholder)
+        assert consolidate_adjacent_placeholders(once, placeholder) == once
 
 
 class TestEscapeSequences:
     """Test JavaScript escape sequence decoding in URLs."""
 
-    def test_escape_sequences_in_urls(self):
+    def test_escape_sequences_in_urls(self, urls_for):
         """Test that various JavaScript escape sequences are decoded in extracted URLs."""
-        node, file_size = parse_file('escape_sequences.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+        urls = urls_for('escape_sequences.js')
 
         # All escaped equals signs should be decoded to '='
         assert '/api/example?param1=value1' in urls
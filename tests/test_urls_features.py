@@ -9,85 +9,88 @@ Covers:
 - Custom file extensions
 """
 
-import os
 import pytest
-import tree_sitter_javascript
+import threading
 
-from tree_sitter import Parser, Language
+from functools import lru_cache
 from sawari.core.jsparser import parse_javascript
-from sawari.modes.urls import get_urls
+from sawari.modes.urls import aliases
+from sawari.modes.urls.extractor import _extract_url_entries
+from sawari.modes.urls import (
+    get_urls,
+    build_symbol_table,
+    format_output,
+    get_custom_extensions,
+    set_custom_extensions,
+)
 
 
-# Path to test fixtures
-FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'urls')
+@lru_cache(maxsize=128)
+def parse_js(code):
+    """Parse inline JavaScript once per distinct source (cached, trees are read-only).
 
+    Keyed on the str literal itself: a hit costs one hash lookup and skips
+    both the UTF-8 encode and the parse.
+    """
+    return parse_javascript(code)[1]
 
-def parse_file(filename):
-    """Helper to parse a JavaScript file from fixtures."""
-    filepath = os.path.join(FIXTURES_DIR, filename)
-    with open(filepath, 'r') as f:
-        content = f.read()
-    _, root_node = parse_javascript(content)
-    return root_node, len(content.encode('utf8'))
 
+def url_blob(urls):
+    """URLs joined into one string, so a substring assert is a single str search."""
+    return '\n'.join(urls)
 
-class TestRouteParams:
-    """Test route parameter conversion (:id -> {id}, [VERSION] -> {VERSION})."""
-
-    def test_colon_route_params(self):
-        node, file_size = parse_file('route_params.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
-
-        # Should convert :id to {id}
-        assert '/users/{id}' in urls
-        assert '/posts/{postId}/comments/{commentId}' in urls
-        assert '/users/{userId}/profile/{section}' in urls
 
-    def test_bracket_route_params(self):
-        node, file_size = parse_file('route_params.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+def template_blob(urls):
+    """Templated URLs (those without FUZZ) joined into one string for substring asserts."""
+    return '\n'.join(url for url in urls if 'FUZZ' not in url)
 
-        # Should convert [VERSION] to {VERSION}
-        assert 'archives/vendor-list-v{VERSION}.json' in urls
-        assert '/posts/{ID}/comments/{commentId}' in urls
-        assert '/api/{version}/users' in urls
 
-    def test_route_params_with_fuzz(self):
-        node, file_size = parse_file('route_params.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+@pytest.fixture(scope='module')
+def route_params_urls(urls_for):
+    """Templated URLs of route_params.js, shared by every TestRouteParams test."""
+    return urls_for('route_params.js', include_templates=True)
 
-        # Should also output FUZZ versions
-        assert '/users/FUZZ' in urls
-        assert 'archives/vendor-list-vFUZZ.json' in urls
 
-    def test_template_with_route_params(self):
-        node, file_size = parse_file('route_params.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+class TestRouteParams:
+    """Test route parameter conversion (:id -> {id}, [VERSION] -> {VERSION})."""
 
-        # Template string with route params: ${} -> {} and :param -> {param}
-        assert '/users/{userId}/posts/{postId}' in urls
-        assert '/data/{category}/items/{itemId}' in urls
+    @pytest.mark.parametrize('expected', [
+        # :id -> {id}
+        '/users/{id}',
+        '/posts/{postId}/comments/{commentId}',
+        '/users/{userId}/profile/{section}',
+        # [VERSION] -> {VERSION}
+        'archives/vendor-list-v{VERSION}.json',
+        '/posts/{ID}/comments/{commentId}',
+        '/api/{version}/users',
+        # FUZZ versions are output too
+        '/users/FUZZ',
+        'archives/vendor-list-vFUZZ.json',
+        # Template strings: ${} -> {} and :param -> {param}
+        '/users/{userId}/posts/{postId}',
+        '/data/{category}/items/{itemId}',
+    ])
+    def test_route_params(self, route_params_urls, expected):
+        assert expected in route_params_urls
 
 
 class TestComments:
     """Test extraction from JavaScript code in comments."""
 
-    def test_comments_extraction(self):
-        node, file_size = parse_file('comments.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
-
-        # Should extract from regular code
-        assert 'https://visible.example.com/data' in urls
-
-        # Should extract from single-line comment
-        assert 'https://hidden.example.com/api' in urls
-
-        # Should extract from multi-line comment
-        assert 'https://api.example.com/v1' in urls
-        assert '/users/profile' in urls
-
-        # Should extract from inline comment
-        assert 'https://inline.example.com' in urls
+    def test_comments_extraction(self, urls_for):
+        urls = urls_for('comments.js')
+
+        assert {
+            # Regular code
+            'https://visible.example.com/data',
+            # Single-line comment
+            'https://hidden.example.com/api',
+            # Multi-line comment
+            'https://api.example.com/v1',
+            '/users/profile',
+            # Inline comment
+            'https://inline.example.com',
+        } <= urls
 
     def test_javascript_comment_with_plain_text_urls(self):
         """Should extract URLs from plain text in JavaScript comments."""
@@ -96,11 +99,11 @@ class TestComments:
         /* New endpoint: https://new-api.example.com/v2 */
         const x = 1;
         '''
-        _, root_node = parse_javascript(code)
-        urls = get_urls(root_node, 'FUZZ', include_templates=False, verbose=False, file_size=len(code.encode('utf8')))
+        source = code.encode('utf8')
+        _, root_node = parse_javascript(source)
+        urls = get_urls(root_node, 'FUZZ', False, False, file_size=len(source))
 
-        assert 'https://old-api.example.com/v1' in urls
-        assert 'https://new-api.example.com/v2' in urls
+        assert {'https://old-api.example.com/v1', 'https://new-api.example.com/v2'} <= set(urls)
 
     def test_javascript_comment_with_paths(self):
         """Should extract paths from JavaScript comments."""
@@ -110,12 +113,11 @@ class TestComments:
         // Config: ./settings.json
         const x = 1;
         '''
-        _, root_node = parse_javascript(code)
-        urls = get_urls(root_node, 'FUZZ', include_templates=False, verbose=False, file_size=len(code.encode('utf8')))
+        source = code.encode('utf8')
+        _, root_node = parse_javascript(source)
+        urls = get_urls(root_node, 'FUZZ', False, False, file_size=len(source))
 
-        assert '/api/v1/users' in urls
-        assert '/api/v2/users' in urls
-        assert './settings.json' in urls
+        assert {'/api/v1/users', '/api/v2/users', './settings.json'} <= set(urls)
 
 
 class TestSemanticAliases:
@@ -123,16 +125,8 @@ class TestSemanticAliases:
 
     @staticmethod
     def extract_urls(js_code):
-        """Helper to extract URLs from JavaScript code."""
-        JS_LANGUAGE = Language(tree_sitter_javascript.language())
-        parser = Parser(JS_LANGUAGE)
-        tree = parser.parse(bytes(js_code, 'utf8'))
-        return get_urls(
-            node=tree.root_node,
-            placeholder='FUZZ',
-            include_templates=True,
-            verbose=False
-        )
+        """Helper to extract URLs from JavaScript code as a frozenset."""
+        return frozenset(get_urls(parse_js(js_code), 'FUZZ', True, False))
 
     def test_object_literal_aliases(self):
         """Test extraction of aliases from object literals."""
@@ -146,16 +140,17 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should use semantic names from object literal
-        assert any('{contentId}' in url for url in urls), \
+        joined = url_blob(urls)
+        assert '{contentId}' in joined, \
             "Expected {contentId} in template output"
-        assert any('{orderBy}' in url for url in urls), \
+        assert '{orderBy}' in joined, \
             "Expected {orderBy} in template output"
 
         # Should NOT use generic variable names when alias exists
-        template_urls = [u for u in urls if '{' in u and '}' in u and 'FUZZ' not in u]
-        assert not any('{t}' in url for url in template_urls), \
+        templates = template_blob(urls)
+        assert '{t}' not in templates, \
             "Should not use {t} when {contentId} alias exists"
-        assert not any('{r}' in url for url in template_urls), \
+        assert '{r}' not in templates, \
             "Should not use {r} when {orderBy} alias exists"
 
     def test_urlsearchparams_aliases(self):
@@ -169,7 +164,7 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should preserve semantic name
-        assert any('{userId}' in url for url in urls), \
+        assert '{userId}' in url_blob(urls), \
             "Expected {userId} in template output"
 
     def test_concatenation_with_aliases(self):
@@ -183,7 +178,7 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should use semantic name from object literal
-        assert any('{postId}' in url for url in urls), \
+        assert '{postId}' in url_blob(urls), \
             "Expected {postId} in concatenated URL"
 
     def test_multiple_aliases_same_variable(self):
@@ -198,8 +193,7 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should prefer 'id' over 'tempValue' (shorter, less generic)
-        template_urls = [u for u in urls if '{' in u and '}' in u and 'FUZZ' not in u]
-        assert any('{id}' in url for url in template_urls), \
+        assert '{id}' in template_blob(urls), \
             "Expected {id} to be chosen as best alias"
 
     def test_no_alias_fallback(self):
@@ -212,7 +206,7 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should use original variable name when no alias
-        assert any('{mySpecialId}' in url for url in urls), \
+        assert '{mySpecialId}' in url_blob(urls), \
             "Expected {mySpecialId} when no alias exists"
 
     def test_formdata_aliases(self):
@@ -227,7 +221,7 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should extract alias from FormData.append
-        assert any('{userId}' in url for url in urls), \
+        assert '{userId}' in url_blob(urls), \
             "Expected {userId} from FormData.append pattern"
 
     def test_member_expression_with_alias(self):
@@ -241,9 +235,42 @@ class TestSemanticAliases:
         urls = self.extract_urls(js_code)
 
         # Should use alias for base variable in member expression
-        assert any('{config.id}' in url for url in urls), \
+        assert '{config.id}' in url_blob(urls), \
             "Expected {config.id} using alias for base variable"
 
+    def test_nested_block_aliases_with_shared_index(self):
+        """Block aliases cached by node id must still resolve per enclosing scope."""
+        js_code = """
+        const a = '1';
+        const outer = { accountId: a };
+        function load() {
+            const inner = { orgId: a };
+            return `/api/orgs/${a}`;
+        }
+        const url = `/api/accounts/${a}`;
+        """
+
+        urls = self.extract_urls(js_code)
+
+        # Inner scope sees both candidates and picks the shorter one,
+        # the top-level template only sees the program-level object
+        assert '/api/orgs/{orgId}' in urls
+        assert '/api/accounts/{accountId}' in urls
+
+    def test_aliases_skipped_without_templates(self):
+        """Skipping alias lookups for include_templates=False must not change the output."""
+        js_code = """
+        const t = '123';
+        const params = { contentId: t };
+        const url = `/api/content/${t}`;
+        """
+
+        root_node = parse_js(js_code)
+        url_entries, mime_types = _extract_url_entries(root_node, 'FUZZ', False, resolve_aliases=True)
+
+        assert get_urls(root_node, 'FUZZ', False, False) == \
+            format_output(url_entries, False, 'FUZZ', mime_types)
+
     def test_skip_aliases_flag(self):
         """Test that --skip-aliases flag disables semantic alias extraction."""
         js_code = """
@@ -252,42 +279,55 @@ class TestSemanticAliases:
         const url = `/api/content/${t}`;
         """
 
-        JS_LANGUAGE = Language(tree_sitter_javascript.language())
-        parser = Parser(JS_LANGUAGE)
-        tree = parser.parse(bytes(js_code, 'utf8'))
+        root_node = parse_js(js_code)
 
         # With semantic aliases (default)
-        urls_with_aliases = get_urls(
-            node=tree.root_node,
-            placeholder='FUZZ',
-            include_templates=True,
-            verbose=False,
-            skip_aliases=False
-        )
+        urls_with_aliases = get_urls(root_node, 'FUZZ', True, False, skip_aliases=False)
 
         # Without semantic aliases
-        urls_without_aliases = get_urls(
-            node=tree.root_node,
-            placeholder='FUZZ',
-            include_templates=True,
-            verbose=False,
-            skip_aliases=True
-        )
+        urls_without_aliases = get_urls(root_node, 'FUZZ', True, False, skip_aliases=True)
+
+        joined_with_aliases = url_blob(urls_with_aliases)
+        joined_without_aliases = url_blob(urls_without_aliases)
 
         # With aliases: should see {contentId}
-        assert any('{contentId}' in url for url in urls_with_aliases), \
+        assert '{contentId}' in joined_with_aliases, \
             f"Expected {{contentId}} with aliases enabled, got: {urls_with_aliases}"
 
         # Without aliases: should see {t}
-        assert any('{t}' in url for url in urls_without_aliases), \
+        assert '{t}' in joined_without_aliases, \
             f"Expected {{t}} with aliases disabled, got: {urls_without_aliases}"
 
         # Ensure we DON'T see the opposite
-        assert not any('{t}' in url for url in urls_with_aliases), \
+        assert '{t}' not in joined_with_aliases, \
             f"Should not see {{t}} with aliases enabled"
-        assert not any('{contentId}' in url for url in urls_without_aliases), \
+        assert '{contentId}' not in joined_without_aliases, \
             f"Should not see {{contentId}} with aliases disabled"
 
+    def test_symbol_table_without_alias_table(self, monkeypatch):
+        """Pass 1 with alias_table=None still resolves symbols but records no aliases."""
+        js_code = """
+        const t = '123';
+        const params = { contentId: t };
+        """
+
+        root_node = parse_js(js_code)
+        symbol_table, object_table, alias_table = {}, {}, {}
+
+        build_symbol_table(root_node, 'FUZZ', symbol_table, object_table, {}, alias_table)
+        assert alias_table == {'t': [{'alias': 'contentId', 'confidence': 'high'}]}
+
+        # Record every alias pass 1 would add, wherever it would store it
+        added_aliases = []
+        monkeypatch.setattr(aliases, 'add_alias', lambda *args, **kwargs: added_aliases.append(args))
+
+        symbol_table_no_aliases, object_table_no_aliases = {}, {}
+        build_symbol_table(root_node, 'FUZZ', symbol_table_no_aliases, object_table_no_aliases, {}, None)
+
+        assert added_aliases == []
+        assert symbol_table_no_aliases == symbol_table
+        assert object_table_no_aliases == object_table
+
     def test_large_file_disables_aliases(self):
         """Test that large files automatically disable semantic aliases."""
         js_code = """
@@ -296,121 +336,96 @@ class TestSemanticAliases:
         const url = `/api/content/${t}`;
         """
 
-        JS_LANGUAGE = Language(tree_sitter_javascript.language())
-        parser = Parser(JS_LANGUAGE)
-        tree = parser.parse(bytes(js_code, 'utf8'))
+        root_node = parse_js(js_code)
 
         # Small file - aliases enabled
-        urls_small = get_urls(
-            node=tree.root_node,
-            placeholder='FUZZ',
-            include_templates=True,
-            verbose=False,
-            file_size=100,
-            max_file_size_mb=1.0
-        )
+        urls_small = get_urls(root_node, 'FUZZ', True, False, file_size=100, max_file_size_mb=1.0)
 
         # Large file - aliases disabled automatically
-        urls_large = get_urls(
-            node=tree.root_node,
-            placeholder='FUZZ',
-            include_templates=True,
-            verbose=False,
-            file_size=2 * 1024 * 1024,  # 2MB
-            max_file_size_mb=1.0
-        )
+        urls_large = get_urls(root_node, 'FUZZ', True, False, file_size=2 * 1024 * 1024, max_file_size_mb=1.0)
 
         # Small file should have aliases
-        assert any('{contentId}' in url for url in urls_small), \
+        assert '{contentId}' in url_blob(urls_small), \
             f"Expected {{contentId}} for small file, got: {urls_small}"
 
         # Large file should use raw variable names
-        assert any('{t}' in url for url in urls_large), \
+        joined_large = url_blob(urls_large)
+        assert '{t}' in joined_large, \
             f"Expected {{t}} for large file, got: {urls_large}"
-        assert not any('{contentId}' in url for url in urls_large), \
+        assert '{contentId}' not in joined_large, \
             f"Should not see {{contentId}} for large file"
 
 
 class TestSkipSymbols:
     """Test --skip-symbols functionality."""
 
-    def test_skip_symbols_flag(self):
-        """Test that --skip-symbols prevents symbol resolution."""
-        node, file_size = parse_file('skip_symbols_basic.js')
+    # String literals of skip_symbols_basic.js, found with or without symbols
+    LITERAL_PATHS = frozenset(('/api/v1', '/users', '/static/path'))
 
+    def test_skip_symbols_flag(self, urls_for):
+        """Test that --skip-symbols prevents symbol resolution."""
         # With symbol resolution (default)
-        urls_with_symbols = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=False)
-        assert '/api/v1' in urls_with_symbols
-        assert '/users' in urls_with_symbols
-        assert '/static/path' in urls_with_symbols
-        assert '/api/v1/users' in urls_with_symbols  # Should resolve the concatenation
+        urls_with_symbols = urls_for('skip_symbols_basic.js')
+        # Should resolve the concatenation
+        assert self.LITERAL_PATHS.union(['/api/v1/users']) <= urls_with_symbols
 
         # Without symbol resolution (--skip-symbols)
-        urls_without_symbols = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=True)
-        assert '/api/v1' in urls_without_symbols
-        assert '/users' in urls_without_symbols
-        assert '/static/path' in urls_without_symbols
+        urls_without_symbols = urls_for('skip_symbols_basic.js', skip_symbols=True)
+        assert self.LITERAL_PATHS <= urls_without_symbols
         assert '/api/v1/users' not in urls_without_symbols  # Should NOT resolve the concatenation
 
-    def test_skip_symbols_with_large_file(self):
+    def test_skip_symbols_with_large_file(self, urls_for):
         """Test that large files automatically skip symbols."""
-        node, file_size = parse_file('skip_symbols_simple.js')
-
         # Small file size - should use symbols
-        urls = get_urls(node, 'FUZZ', False, False, file_size=100, max_file_size_mb=1.0, skip_symbols=False)
+        urls = urls_for('skip_symbols_simple.js', file_size=100, max_file_size_mb=1.0, skip_symbols=False)
         assert '/api/test' in urls
 
         # Large file size - should skip symbols automatically
-        urls = get_urls(node, 'FUZZ', False, False, file_size=2 * 1024 * 1024, max_file_size_mb=1.0, skip_symbols=False)
+        urls = urls_for('skip_symbols_simple.js', file_size=2 * 1024 * 1024, max_file_size_mb=1.0, skip_symbols=False)
         assert '/api/test' in urls
 
         # Explicit skip_symbols overrides file size check
-        urls = get_urls(node, 'FUZZ', False, False, file_size=100, max_file_size_mb=1.0, skip_symbols=True)
+        urls = urls_for('skip_symbols_simple.js', file_size=100, max_file_size_mb=1.0, skip_symbols=True)
         assert '/api/test' in urls
 
-    def test_skip_symbols_with_templates(self):
+    def test_skip_symbols_with_templates(self, urls_for):
         """Test skip_symbols with template strings."""
-        node, file_size = parse_file('skip_symbols_template.js')
-
-        # With symbol resolution
-        urls_with = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=False)
-        assert any('/users/' in url for url in urls_with)
+        # With symbol resolution (default)
+        urls_with = urls_for('skip_symbols_template.js')
+        assert '/users/' in url_blob(urls_with)
 
         # Without symbol resolution - should still extract templates with placeholder
-        urls_without = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=True)
-        assert any('/users/' in url for url in urls_without)
+        urls_without = urls_for('skip_symbols_template.js', skip_symbols=True)
+        assert '/users/' in url_blob(urls_without)
 
-    def test_skip_symbols_with_objects(self):
+    def test_skip_symbols_with_objects(self, urls_for):
         """Test skip_symbols with object properties."""
-        node, file_size = parse_file('skip_symbols_objects.js')
-
-        # With symbol resolution
-        urls_with = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=False)
-        assert '/api/v2' in urls_with
-        assert '/data' in urls_with
-        assert '/api/v2/data' in urls_with  # Should resolve object properties
+        # With symbol resolution (default)
+        urls_with = urls_for('skip_symbols_objects.js')
+        assert {'/api/v2', '/data', '/api/v2/data'} <= urls_with  # Should resolve object properties
 
         # Without symbol resolution
-        urls_without = get_urls(node, 'FUZZ', False, False, file_size=file_size, skip_symbols=True)
-        assert '/api/v2' in urls_without
-        assert '/data' in urls_without
+        urls_without = urls_for('skip_symbols_objects.js', skip_symbols=True)
+        assert {'/api/v2', '/data'} <= urls_without
         assert '/api/v2/data' not in urls_without  # Should NOT resolve object properties
 
 
 class TestCustomExtensions:
     """Test custom file extensions support."""
 
-    def test_custom_extensions_with_paths(self):
-        """Should recognize custom extensions in paths."""
-        node, file_size = parse_file('custom_extensions.js')
+    EXTENSION_PATHS = frozenset(('api/schema.proto', 'queries/user.graphql'))
 
+    def test_custom_extensions_with_paths(self, urls_for):
+        """Should recognize custom extensions in paths."""
         # Without custom extensions - only recognize standard extensions
-        urls_default = get_urls(node, 'FUZZ', False, False, file_size=file_size, extensions=None)
-        assert 'config.json' in urls_default
+        urls_default = urls_for('custom_extensions.js', extensions=None)
         # Proto, graphql, mdx should be extracted as paths even without extension recognition
-        assert 'api/schema.proto' in urls_default
-        assert 'queries/user.graphql' in urls_default
-        assert './docs/readme.mdx' in urls_default
+        assert {
+            'config.json',
+            'api/schema.proto',
+            'queries/user.graphql',
+            './docs/readme.mdx',
+        } <= urls_default
 
     def test_custom_extensions_normalization(self):
         """Should normalize extensions with/without dots."""
@@ -418,17 +433,17 @@ class TestCustomExtensions:
         const file1 = "api/schema.proto";
         const file2 = "queries/user.graphql";
         '''
-        _, root_node = parse_javascript(code)
+        source = code.encode('utf8')
+        _, root_node = parse_javascript(source)
+        file_size = len(source)
 
         # Test with dots
-        urls_with_dots = get_urls(root_node, 'FUZZ', False, False, file_size=len(code.encode('utf8')), extensions='.proto,.graphql')
-        assert 'api/schema.proto' in urls_with_dots
-        assert 'queries/user.graphql' in urls_with_dots
+        urls_with_dots = get_urls(root_node, 'FUZZ', False, False, file_size=file_size, extensions='.proto,.graphql')
+        assert self.EXTENSION_PATHS <= set(urls_with_dots)
 
         # Test without dots
-        urls_without_dots = get_urls(root_node, 'FUZZ', False, False, file_size=len(code.encode('utf8')), extensions='proto,graphql')
-        assert 'api/schema.proto' in urls_without_dots
-        assert 'queries/user.graphql' in urls_without_dots
+        urls_without_dots = get_urls(root_node, 'FUZZ', False, False, file_size=file_size, extensions='proto,graphql')
+        assert self.EXTENSION_PATHS <= set(urls_without_dots)
 
     def test_custom_extensions_multiple(self):
         """Should handle multiple custom extensions."""
@@ -437,12 +452,30 @@ class TestCustomExtensions:
         const graphql = "query.graphql";
         const mdx = "readme.mdx";
         '''
-        _, root_node = parse_javascript(code)
+        source = code.encode('utf8')
+        _, root_node = parse_javascript(source)
+
+        # Standalone filenames are only extracted when their extension is recognized
+        urls = get_urls(root_node, 'FUZZ', False, False, file_size=len(source), extensions='proto,graphql,mdx')
+        assert set(urls) == {'schema.proto', 'query.graphql', 'readme.mdx'}
+
+        assert get_urls(root_node, 'FUZZ', False, False, file_size=len(source)) == []
+
+    def test_custom_extensions_are_per_thread(self):
+        """Extensions set in one thread should not leak into another."""
+        set_custom_extensions('')
+        seen = []
+
+        def worker():
+            set_custom_extensions('proto')
+            seen.append(get_custom_extensions())
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
 
-        urls = get_urls(root_node, 'FUZZ', False, False, file_size=len(code.encode('utf8')), extensions='proto,graphql,mdx')
-        # Simple filenames without paths won't be extracted unless they're recognized extensions
-        # But paths with these extensions should work
-        assert len(urls) >= 0  # May or may not extract standalone filenames
+        assert seen == [{'proto'}]
+        assert not get_custom_extensions()
 
 
 if __name__ == '__main__':
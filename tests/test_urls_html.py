@@ -1,6 +1,3 @@
-import pytest
-
-from pathlib import Path
 from sawari.core.jsparser import parse_javascript
 from sawari.modes.urls import get_urls
 
@@ -9,24 +6,12 @@ Tests for HTML URL extraction integration in urls.py
 """
 
 
-# Test fixtures directory
-FIXTURES_DIR = Path(__file__).parent / 'fixtures' / 'html'
-
-
-def parse_js_file(filename):
-    """Helper to parse JavaScript from fixture file."""
-    filepath = FIXTURES_DIR / filename
-    code = filepath.read_text()
-    return parse_javascript(code)
-
-
 class TestHtmlInStrings:
     """Test HTML URL extraction from string literals."""
 
-    def test_simple_html_anchor(self):
+    def test_simple_html_anchor(self, html_urls_for):
         """Extract href from anchor tag in string."""
-        _, root = parse_js_file('simple_anchor.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('simple_anchor.js')
         assert '/api/users' in urls
 
     def test_html_img_src(self):
@@ -36,10 +21,9 @@ class TestHtmlInStrings:
         urls = get_urls(root, 'FUZZ', False, False)
         assert 'https://cdn.example.com/logo.png' in urls
 
-    def test_multiple_html_tags(self):
+    def test_multiple_html_tags(self, html_urls_for):
         """Extract URLs from multiple HTML tags."""
-        _, root = parse_js_file('multiple_tags.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('multiple_tags.js')
         assert '/api/v1' in urls
         assert '/icon.png' in urls
         assert '/style.css' in urls
@@ -107,10 +91,9 @@ class TestHtmlSrcset:
         urls = get_urls(root, 'FUZZ', False, False)
         assert 'image.jpg' in urls
 
-    def test_srcset_multiple_images(self):
+    def test_srcset_multiple_images(self, html_urls_for):
         """Extract all URLs from srcset with multiple images."""
-        _, root = parse_js_file('srcset.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('srcset.js')
         assert 'thumb.jpg' in urls
         assert 'medium.jpg' in urls
         assert 'large.jpg' in urls
@@ -140,10 +123,9 @@ class TestHtmlDataAttributes:
         urls = get_urls(root, 'FUZZ', False, False)
         assert '/profile' in urls
 
-    def test_multiple_data_attributes(self):
+    def test_multiple_data_attributes(self, html_urls_for):
         """Extract URLs from multiple data attributes."""
-        _, root = parse_js_file('data_attributes.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('data_attributes.js')
         assert '/main.jpg' in urls
         assert 'https://fallback.com/image.png' in urls
 
@@ -151,16 +133,14 @@ class TestHtmlDataAttributes:
 class TestHtmlInTemplateStrings:
     """Test HTML URL extraction from template string literals."""
 
-    def test_template_string_with_html(self):
+    def test_template_string_with_html(self, html_urls_for):
         """Extract URLs from HTML in template string."""
-        _, root = parse_js_file('template_string.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('template_string.js')
         assert '/dashboard' in urls
 
-    def test_template_string_full_page(self):
+    def test_template_string_full_page(self, html_urls_for):
         """Extract URLs from complete HTML page in template string."""
-        _, root = parse_js_file('template_full_page.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('template_full_page.js')
         assert '/styles.css' in urls
         assert '/home' in urls
         assert '/app.js' in urls
@@ -183,10 +163,9 @@ class TestInlineScripts:
         urls = get_urls(root, 'FUZZ', False, False)
         assert '/api/users' in urls
 
-    def test_inline_script_with_multiple_urls(self):
+    def test_inline_script_with_multiple_urls(self, html_urls_for):
         """Extract multiple URLs from inline script."""
-        _, root = parse_js_file('inline_script.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('inline_script.js')
         assert '/api/data' in urls
         assert 'https://analytics.com/track' in urls
         assert '/redirect' in urls
@@ -197,7 +176,7 @@ class TestInlineScripts:
         _, root = parse_javascript(js)
         urls = get_urls(root, 'FUZZ', False, False)
         # Should extract template with placeholder
-        assert any('/api/' in url for url in urls)
+        assert '/api/' in '\n'.join(urls)
 
     def test_multiple_inline_scripts(self):
         """Extract URLs from multiple inline script tags."""
@@ -212,10 +191,9 @@ const html = `
         assert '/api/first' in urls
         assert '/api/second' in urls
 
-    def test_mixed_inline_and_external_scripts(self):
+    def test_mixed_inline_and_external_scripts(self, html_urls_for):
         """Extract URLs from both inline and external scripts."""
-        _, root = parse_js_file('mixed_scripts.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('mixed_scripts.js')
         assert '/external.js' in urls
         assert '/api/inline' in urls
 
@@ -223,10 +201,9 @@ const html = `
 class TestHtmlAndJavaScriptCombined:
     """Test extraction from both HTML and JavaScript in the same file."""
 
-    def test_nested_structures(self):
+    def test_nested_structures(self, html_urls_for):
         """Extract URLs from nested objects containing HTML."""
-        _, root = parse_js_file('nested_structures.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('nested_structures.js')
         # HTML template URLs
         assert '/api/resource' in urls
         assert 'image.png' in urls
@@ -235,10 +212,9 @@ class TestHtmlAndJavaScriptCombined:
         assert '/path1' in urls
         assert '/path2' in urls
 
-    def test_full_integration(self):
+    def test_full_integration(self, html_urls_for):
         """Extract URLs from both HTML attributes and inline scripts."""
-        _, root = parse_js_file('full_page.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('full_page.js')
 
         # HTML attributes
         assert '/styles/main.css' in urls
@@ -256,10 +232,9 @@ class TestHtmlAndJavaScriptCombined:
         assert 'https://external.com/track' in urls
         assert '/redirect' in urls
 
-    def test_nested_html_structures(self):
+    def test_nested_html_structures(self, html_urls_for):
         """Extract URLs from nested HTML structures."""
-        _, root = parse_js_file('nested_html_structures.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('nested_html_structures.js')
         assert '/home' in urls
         assert '/about' in urls
         assert '/hero.jpg' in urls
@@ -302,30 +277,27 @@ class TestHtmlParserOptions:
 class TestHtmlEdgeCases:
     """Test edge cases in HTML processing."""
 
-    def test_malformed_html(self):
+    def test_malformed_html(self, html_urls_for):
         """Handle malformed HTML gracefully."""
-        _, root = parse_js_file('malformed.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('malformed.js')
         assert '/valid' in urls
         assert 'image.jpg' in urls
 
-    def test_empty_html_string(self):
+    def test_empty_html_string(self, html_urls_for):
         """Handle empty HTML string."""
-        _, root = parse_js_file('empty_strings.js')
-        urls = get_urls(root, 'FUZZ', False, False)
-        assert urls == []
+        urls = html_urls_for('empty_strings.js')
+        assert not urls
 
     def test_html_without_urls(self):
         """Handle HTML without any URLs."""
         js = '''const html = '<div>Text content</div>';'''
         _, root = parse_javascript(js)
         urls = get_urls(root, 'FUZZ', False, False)
-        assert urls == []
+        assert not urls
 
-    def test_skip_javascript_protocol(self):
+    def test_skip_javascript_protocol(self, html_urls_for):
         """Skip javascript:, tel:, and mailto: protocol URLs."""
-        _, root = parse_js_file('skip_protocols.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('skip_protocols.js')
         assert 'javascript:void(0)' not in urls
         assert 'mailto:test@example.com' not in urls  # Skip mailto: URLs
         assert 'tel:+1234567890' not in urls
@@ -336,20 +308,18 @@ class TestHtmlEdgeCases:
         js = '''const html = '<img src="data:image/png;base64,...">';'''
         _, root = parse_javascript(js)
         urls = get_urls(root, 'FUZZ', False, False)
-        assert not any('data:' in url for url in urls)
+        assert 'data:' not in '\n'.join(urls)
 
-    def test_skip_fragment_only(self):
+    def test_skip_fragment_only(self, html_urls_for):
         """Skip fragment-only URLs."""
-        _, root = parse_js_file('fragments.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('fragments.js')
         assert '#section' not in urls
         # But page with fragment should still extract the page part
-        assert any('/page' in url for url in urls)
+        assert '/page' in '\n'.join(urls)
 
-    def test_mixed_quotes_in_html(self):
+    def test_mixed_quotes_in_html(self, html_urls_for):
         """Handle mixed quotes in HTML attributes."""
-        _, root = parse_js_file('mixed_quotes.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('mixed_quotes.js')
         assert '/api/users' in urls
         assert '/api/posts' in urls
 
@@ -357,48 +327,41 @@ class TestHtmlEdgeCases:
 class TestCitationElements:
     """Test URL extraction from citation HTML elements."""
 
-    def test_blockquote_cite(self):
+    def test_blockquote_cite(self, html_urls_for):
         """Extract cite URL from blockquote."""
-        _, root = parse_js_file('citation_elements.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('citation_elements.js')
         assert 'https://source.com/article' in urls
 
-    def test_q_cite(self):
+    def test_q_cite(self, html_urls_for):
         """Extract cite URL from q element."""
-        _, root = parse_js_file('citation_elements.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('citation_elements.js')
         assert '/local/source' in urls
 
-    def test_ins_cite(self):
+    def test_ins_cite(self, html_urls_for):
         """Extract cite URL from ins element."""
-        _, root = parse_js_file('citation_elements.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('citation_elements.js')
         assert '/changelog#v2' in urls
 
-    def test_del_cite(self):
+    def test_del_cite(self, html_urls_for):
         """Extract cite URL from del element."""
-        _, root = parse_js_file('citation_elements.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('citation_elements.js')
         assert '/changelog#v1' in urls
 
 
 class TestObjectAndEmbed:
     """Test URL extraction from object and embed elements."""
 
-    def test_object_data(self):
+    def test_object_data(self, html_urls_for):
         """Extract data URL from object element."""
-        _, root = parse_js_file('object_embed.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('object_embed.js')
         assert '/media/video.mp4' in urls
 
-    def test_object_codebase(self):
+    def test_object_codebase(self, html_urls_for):
         """Extract codebase URL from object element."""
-        _, root = parse_js_file('object_embed.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('object_embed.js')
         assert '/plugins/' in urls
 
-    def test_embed_src(self):
+    def test_embed_src(self, html_urls_for):
         """Extract src URL from embed element."""
-        _, root = parse_js_file('object_embed.js')
-        urls = get_urls(root, 'FUZZ', False, False)
+        urls = html_urls_for('object_embed.js')
         assert '/flash/player.swf' in urls
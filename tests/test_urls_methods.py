@@ -8,45 +8,25 @@ Covers:
 - Variable reassignment handling
 """
 
-import os
 import pytest
 
-from sawari.core.jsparser import parse_javascript
-from sawari.modes.urls import get_urls
-
-
-# Path to test fixtures
-FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'urls')
-
-
-def parse_file(filename):
-    """Helper to parse a JavaScript file from fixtures."""
-    filepath = os.path.join(FIXTURES_DIR, filename)
-    with open(filepath, 'r') as f:
-        content = f.read()
-    _, root_node = parse_javascript(content)
-    return root_node, len(content.encode('utf8'))
-
 
 class TestChainedConcat:
     """Test chained .concat() method calls."""
 
-    def test_simple_chaining(self):
-        node, file_size = parse_file('chained_concat.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_simple_chaining(self, urls_for):
+        urls = urls_for('chained_concat.js')
 
         assert 'https://api.example.com/v2/users/profile' in urls
 
-    def test_chaining_with_variables(self):
-        node, file_size = parse_file('chained_concat.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_chaining_with_variables(self, urls_for):
+        urls = urls_for('chained_concat.js')
 
         # Should resolve variables in chained concat
         assert 'https://FUZZ/api/login' in urls or 'FUZZ/api/login' in urls
 
-    def test_complex_chaining(self):
-        node, file_size = parse_file('chained_concat.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_complex_chaining(self, urls_for):
+        urls = urls_for('chained_concat.js')
 
         assert 'https://example.com/api/v1/data' in urls
 
@@ -54,27 +34,23 @@ class TestChainedConcat:
 class TestArrayJoin:
     """Test array .join() method."""
 
-    def test_array_join_empty_separator(self):
-        node, file_size = parse_file('array_join.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_array_join_empty_separator(self, urls_for):
+        urls = urls_for('array_join.js')
 
         assert '/api/v2/users' in urls
 
-    def test_array_join_with_separator(self):
-        node, file_size = parse_file('array_join.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_array_join_with_separator(self, urls_for):
+        urls = urls_for('array_join.js')
 
         assert 'https://api.example.com/api/v1/data' in urls
 
-    def test_array_join_with_variables(self):
-        node, file_size = parse_file('array_join.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_array_join_with_variables(self, urls_for):
+        urls = urls_for('array_join.js')
 
         assert 'https://example.com/api/v2/endpoint' in urls
 
-    def test_array_join_in_concatenation(self):
-        node, file_size = parse_file('array_join.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_array_join_in_concatenation(self, urls_for):
+        urls = urls_for('array_join.js')
 
         assert '/users/profile/settings' in urls
 
@@ -82,48 +58,48 @@ class TestArrayJoin:
 class TestReplaceMethod:
     """Test string .replace() method."""
 
-    def test_simple_replace(self):
-        node, file_size = parse_file('replace_method.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_simple_replace(self, urls_for):
+        urls = urls_for('replace_method.js')
 
         assert '/api/v2/users' in urls
 
-    def test_replace_with_variables(self):
-        node, file_size = parse_file('replace_method.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_replace_with_variables(self, urls_for):
+        urls = urls_for('replace_method.js', include_templates=True)
 
         # Replace creates template versions
         assert '/users/{id}/profile' in urls or '/user/{userId}' in urls
         assert '/user/456' in urls
 
-    def test_chained_replace(self):
-        node, file_size = parse_file('replace_method.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_chained_replace(self, urls_for):
+        urls = urls_for('replace_method.js', include_templates=True)
 
         # Multiple .replace() calls should work - check template version
-        assert any('prod' in url or '{env}' in url for url in urls)
+        joined = '\n'.join(urls)
+        assert 'prod' in joined or '{env}' in joined
 
 
 class TestVariableReassignment:
     """Test variable reassignment handling."""
 
-    def test_reassignment_tracking(self):
-        node, file_size = parse_file('variable_reassignment.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_reassignment_tracking(self, urls_for):
+        urls = urls_for('variable_reassignment.js', include_templates=True)
 
         # Should track both values - components extracted
         assert '/api/users' in urls
         assert '/api/products' in urls or '/products' in urls
-        assert '/api' in urls
-        assert '/v2' in urls
+        assert {
+            '/api',
+            '/v2',
+        } <= urls
 
-    def test_object_property_reassignment(self):
-        node, file_size = parse_file('variable_reassignment.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_object_property_reassignment(self, urls_for):
+        urls = urls_for('variable_reassignment.js', include_templates=True)
 
         # Should track object property values - components extracted
-        assert '/api' in urls
-        assert '/v3' in urls
+        assert {
+            '/api',
+            '/v3',
+        } <= urls
         assert '/data' in urls or '/resource' in urls
 
 
@@ -8,52 +8,36 @@ Covers:
 - window.location behavior
 """
 
-import os
 import pytest
 
-from sawari.core.jsparser import parse_javascript
-from sawari.modes.urls import get_urls
-
-
-# Path to test fixtures
-FIXTURES_DIR = os.path.join(os.path.dirname(__file__), 'fixtures', 'urls')
-
-
-def parse_file(filename):
-    """Helper to parse a JavaScript file from fixtures."""
-    filepath = os.path.join(FIXTURES_DIR, filename)
-    with open(filepath, 'r') as f:
-        content = f.read()
-    _, root_node = parse_javascript(content)
-    return root_node, len(content.encode('utf8'))
-
 
 class TestObjectProperties:
     """Test object property access and nested objects."""
 
-    def test_simple_object_properties(self):
-        node, file_size = parse_file('object_properties.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_simple_object_properties(self, urls_for):
+        urls = urls_for('object_properties.js', include_templates=True)
 
         # Object properties extracted, check components
-        assert '/api' in urls
-        assert '/v2' in urls
-        assert '/users' in urls
-        assert '/posts' in urls
+        assert {
+            '/api',
+            '/v2',
+            '/users',
+            '/posts',
+        } <= urls
 
-    def test_nested_object_properties(self):
-        node, file_size = parse_file('object_properties.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_nested_object_properties(self, urls_for):
+        urls = urls_for('object_properties.js', include_templates=True)
 
         # Nested properties extracted
-        assert '/api' in urls
-        assert '/v1' in urls
-        assert '/users' in urls
-        assert '/data' in urls
+        assert {
+            '/api',
+            '/v1',
+            '/users',
+            '/data',
+        } <= urls
 
-    def test_object_property_assignment(self):
-        node, file_size = parse_file('object_properties.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_object_property_assignment(self, urls_for):
+        urls = urls_for('object_properties.js', include_templates=True)
 
         # Property assignments tracked
         assert '/v3' in urls
@@ -62,16 +46,14 @@ class TestObjectProperties:
 class TestMemberExpressions:
     """Test member expression resolution (window.location, nested objects)."""
 
-    def test_window_location_properties(self):
-        node, file_size = parse_file('member_expressions.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_window_location_properties(self, urls_for, has_url_with):
+        urls = urls_for('member_expressions.js', include_templates=True)
 
         # window.location.origin should resolve to https://FUZZ
-        assert any('FUZZ' in url and '/api/users' in url for url in urls)
+        assert has_url_with(urls, 'FUZZ', '/api/users')
 
-    def test_nested_member_expressions(self):
-        node, file_size = parse_file('member_expressions.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_nested_member_expressions(self, urls_for):
+        urls = urls_for('member_expressions.js')
 
         # Deeply nested object properties
         assert 'https://api.example.com/endpoint' in urls or 'https://api.example.com' in urls
@@ -80,53 +62,51 @@ class TestMemberExpressions:
 class TestSubscriptExpressions:
     """Test subscript/bracket notation access."""
 
-    def test_string_literal_subscripts(self):
-        node, file_size = parse_file('subscript_expressions.js')
-        urls = get_urls(node, 'FUZZ', include_templates=False, verbose=False, file_size=file_size)
+    def test_string_literal_subscripts(self, urls_for):
+        urls = urls_for('subscript_expressions.js')
 
         # obj["api-url"] should resolve
-        assert any('https://api.example.com' in url for url in urls)
-        assert any('/api' in url for url in urls)
+        joined = '\n'.join(urls)
+        assert 'https://api.example.com' in joined
+        assert '/api' in joined
 
-    def test_variable_subscripts(self):
-        node, file_size = parse_file('subscript_expressions.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_variable_subscripts(self, urls_for):
+        urls = urls_for('subscript_expressions.js', include_templates=True)
 
         # obj[variable] should resolve if variable value is known
-        assert any('api.example.com' in url or '/api' in url for url in urls)
+        joined = '\n'.join(urls)
+        assert 'api.example.com' in joined or '/api' in joined
 
-    def test_nested_subscripts(self):
-        node, file_size = parse_file('subscript_expressions.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_nested_subscripts(self, urls_for):
+        urls = urls_for('subscript_expressions.js', include_templates=True)
 
         # config["endpoints"]["v1"] should resolve
-        assert any('/api/v1' in url or '/api/v2' in url for url in urls)
+        joined = '\n'.join(urls)
+        assert '/api/v1' in joined or '/api/v2' in joined
 
 
 class TestWindowLocation:
     """Test window.location specific behavior."""
 
-    def test_window_location_defaults(self):
-        node, file_size = parse_file('window_location.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_window_location_defaults(self, urls_for):
+        urls = urls_for('window_location.js', include_templates=True)
 
         # window.location.origin defaults to https://FUZZ
-        assert any('https://FUZZ' in url for url in urls)
+        assert 'https://FUZZ' in '\n'.join(urls)
 
-    def test_location_without_window(self):
-        node, file_size = parse_file('window_location.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_location_without_window(self, urls_for):
+        urls = urls_for('window_location.js', include_templates=True)
 
         # location.origin (without window.) should also work and resolve to https://FUZZ
-        assert any('https://FUZZ' in url for url in urls)
+        assert 'https://FUZZ' in '\n'.join(urls)
 
-    def test_location_concatenation(self):
-        node, file_size = parse_file('window_location.js')
-        urls = get_urls(node, 'FUZZ', include_templates=True, verbose=False, file_size=file_size)
+    def test_location_concatenation(self, urls_for):
+        urls = urls_for('window_location.js', include_templates=True)
 
         # Concatenation with location properties
-        assert any('/api/v1' in url for url in urls)
-        assert any('/search' in url for url in urls)
+        joined = '\n'.join(urls)
+        assert '/api/v1' in joined
+        assert '/search' in joined
 
 
 if __name__ == '__main__':